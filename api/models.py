@@ -340,6 +340,9 @@ class SmartleadCampaignResponse(BaseModel):
     personalization_level: Optional[str] = None
     timestamp: str
 
+class SmartleadBulkCampaignRequest(BaseModel):
+    campaign_ids: List[str]
+
 class SmartleadStatsResponse(BaseModel):
     success: bool
     campaign_id: str
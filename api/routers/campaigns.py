@@ -10,7 +10,7 @@ from ..models import (
     SESBulkEmailRequest, SESTemplateRequest, EmailProviderStats,
     JSearchJobRequest, JSearchJobResponse, JSearchSalaryRequest, JSearchSalaryResponse,
     SmartleadCampaignRequest, SmartleadAICampaignRequest, SmartleadCampaignResponse, 
-    SmartleadStatsResponse, SmartleadAccountResponse
+    SmartleadBulkCampaignRequest, SmartleadStatsResponse, SmartleadAccountResponse
 )
 from ..dependencies import (
     get_current_user, get_job_scraper, get_contact_finder, 
@@ -246,7 +246,7 @@ async def send_ses_email(
     """Send single email via Amazon SES"""
     try:
         ses_manager = get_ses_manager()
-        result = ses_manager.send_email(
+        result = await ses_manager.send_email(
             to_emails=request.to_emails,
             subject=request.subject,
             body_html=request.body_html,
@@ -267,7 +267,7 @@ async def send_ses_bulk_email(
     """Send bulk personalized emails via SES templates"""
     try:
         ses_manager = get_ses_manager()
-        result = ses_manager.send_bulk_emails(
+        result = await ses_manager.send_bulk_emails(
             emails_data=request.emails_data,
             template_name=request.template_name,
             from_email=request.from_email
@@ -419,7 +419,7 @@ async def create_ses_campaign(
                     )
                     
                     # Send via SES
-                    result = ses_manager.send_email(
+                    result = await ses_manager.send_email(
                         to_emails=[lead["email"]],
                         subject=request.subject,
                         body_html=personalized_template,
@@ -588,7 +588,7 @@ async def create_smartlead_campaign(
     """Create a new Smartlead.ai campaign"""
     try:
         smartlead_manager = get_smartlead_manager()
-        result = smartlead_manager.create_campaign(
+        result = await smartlead_manager.create_campaign(
             name=request.name,
             leads=request.leads,
             email_template=request.email_template,
@@ -614,7 +614,7 @@ async def create_smartlead_ai_campaign(
     """Create AI-personalized Smartlead.ai campaign"""
     try:
         smartlead_manager = get_smartlead_manager()
-        result = smartlead_manager.create_ai_personalized_campaign(
+        result = await smartlead_manager.create_ai_personalized_campaign(
             name=request.name,
             leads=request.leads,
             template_context=request.template_context,
@@ -637,7 +637,7 @@ async def get_smartlead_campaigns(current_user: dict = Depends(get_current_user)
     """Get all Smartlead.ai campaigns"""
     try:
         smartlead_manager = get_smartlead_manager()
-        result = smartlead_manager.get_campaigns()
+        result = await smartlead_manager.get_campaigns()
         return result
     except Exception as e:
         logger.error(f"Error getting Smartlead campaigns: {e}")
@@ -651,7 +651,7 @@ async def get_smartlead_campaign_stats(
     """Get detailed statistics for a Smartlead campaign"""
     try:
         smartlead_manager = get_smartlead_manager()
-        result = smartlead_manager.get_campaign_stats(campaign_id)
+        result = await smartlead_manager.get_campaign_stats(campaign_id)
         
         if result.get("success"):
             return SmartleadStatsResponse(**result)
@@ -670,7 +670,7 @@ async def pause_smartlead_campaign(
     """Pause a Smartlead campaign"""
     try:
         smartlead_manager = get_smartlead_manager()
-        result = smartlead_manager.pause_campaign(campaign_id)
+        result = await smartlead_manager.pause_campaign(campaign_id)
         return result
     except Exception as e:
         logger.error(f"Error pausing Smartlead campaign: {e}")
@@ -684,12 +684,40 @@ async def resume_smartlead_campaign(
     """Resume a paused Smartlead campaign"""
     try:
         smartlead_manager = get_smartlead_manager()
-        result = smartlead_manager.resume_campaign(campaign_id)
+        result = await smartlead_manager.resume_campaign(campaign_id)
         return result
     except Exception as e:
         logger.error(f"Error resuming Smartlead campaign: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/smartlead/campaigns/pause")
+async def pause_smartlead_campaigns(
+    request: SmartleadBulkCampaignRequest,
+    current_user: dict = Depends(get_current_user)
+):
+    """Pause several Smartlead campaigns at once"""
+    try:
+        smartlead_manager = get_smartlead_manager()
+        results = await smartlead_manager.pause_many(request.campaign_ids)
+        return {"results": results, "timestamp": datetime.now().isoformat()}
+    except Exception as e:
+        logger.error(f"Error pausing Smartlead campaigns: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/smartlead/campaigns/resume")
+async def resume_smartlead_campaigns(
+    request: SmartleadBulkCampaignRequest,
+    current_user: dict = Depends(get_current_user)
+):
+    """Resume several paused Smartlead campaigns at once"""
+    try:
+        smartlead_manager = get_smartlead_manager()
+        results = await smartlead_manager.resume_many(request.campaign_ids)
+        return {"results": results, "timestamp": datetime.now().isoformat()}
+    except Exception as e:
+        logger.error(f"Error resuming Smartlead campaigns: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.delete("/smartlead/campaign/{campaign_id}")
 async def delete_smartlead_campaign(
     campaign_id: str,
@@ -698,7 +726,7 @@ async def delete_smartlead_campaign(
     """Delete a Smartlead campaign"""
     try:
         smartlead_manager = get_smartlead_manager()
-        result = smartlead_manager.delete_campaign(campaign_id)
+        result = await smartlead_manager.delete_campaign(campaign_id)
         return result
     except Exception as e:
         logger.error(f"Error deleting Smartlead campaign: {e}")
@@ -709,7 +737,7 @@ async def get_smartlead_account_info(current_user: dict = Depends(get_current_us
     """Get Smartlead account information and limits"""
     try:
         smartlead_manager = get_smartlead_manager()
-        result = smartlead_manager.get_account_info()
+        result = await smartlead_manager.get_account_info()
         
         if result.get("success"):
             return SmartleadAccountResponse(**result)
@@ -725,7 +753,7 @@ async def get_smartlead_status(current_user: dict = Depends(get_current_user)):
     """Test Smartlead API connection and key validity"""
     try:
         smartlead_manager = get_smartlead_manager()
-        result = smartlead_manager.test_api_connection()
+        result = await smartlead_manager.test_api_connection()
         return result
     except Exception as e:
         logger.error(f"Error checking Smartlead status: {e}")
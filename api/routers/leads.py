@@ -1108,30 +1108,30 @@ async def search_jobs_preview(request: JobSearchRequest):
 
 # Progressive Agent Data Endpoints
 @router.get("/leads/jobs")
-async def get_all_jobs(limit: int = 100):
+async def get_all_jobs(limit: int = 100, offset: int = 0):
     """Get all jobs from progressive agents"""
     try:
-        jobs = await progressive_agent_db.get_agent_jobs(limit=limit)
+        jobs = await progressive_agent_db.get_agent_jobs(offset=offset, limit=limit)
         return {"success": True, "data": jobs, "count": len(jobs)}
     except Exception as e:
         logger.error(f"Error getting jobs: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/leads/contacts")
-async def get_all_contacts(limit: int = 100):
+async def get_all_contacts(limit: int = 100, offset: int = 0):
     """Get all contacts from progressive agents"""
     try:
-        contacts = await progressive_agent_db.get_agent_contacts(limit=limit)
+        contacts = await progressive_agent_db.get_agent_contacts(offset=offset, limit=limit)
         return {"success": True, "data": contacts, "count": len(contacts)}
     except Exception as e:
         logger.error(f"Error getting contacts: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/leads/campaigns")
-async def get_all_campaigns(limit: int = 100):
+async def get_all_campaigns(limit: int = 100, offset: int = 0):
     """Get all campaigns from progressive agents"""
     try:
-        campaigns = await progressive_agent_db.get_agent_campaigns(limit=limit)
+        campaigns = await progressive_agent_db.get_agent_campaigns(offset=offset, limit=limit)
         return {"success": True, "data": campaigns, "count": len(campaigns)}
     except Exception as e:
         logger.error(f"Error getting campaigns: {e}")
@@ -1148,30 +1148,30 @@ async def get_dashboard_stats():
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/leads/agent/{agent_id}/jobs")
-async def get_agent_jobs(agent_id: str, limit: int = 100):
+async def get_agent_jobs(agent_id: str, limit: int = 100, offset: int = 0):
     """Get jobs for a specific agent"""
     try:
-        jobs = await progressive_agent_db.get_agent_jobs(agent_id=agent_id, limit=limit)
+        jobs = await progressive_agent_db.get_agent_jobs(agent_id=agent_id, offset=offset, limit=limit)
         return {"success": True, "data": jobs, "count": len(jobs)}
     except Exception as e:
         logger.error(f"Error getting agent jobs: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/leads/agent/{agent_id}/contacts")
-async def get_agent_contacts(agent_id: str, limit: int = 100):
+async def get_agent_contacts(agent_id: str, limit: int = 100, offset: int = 0):
     """Get contacts for a specific agent"""
     try:
-        contacts = await progressive_agent_db.get_agent_contacts(agent_id=agent_id, limit=limit)
+        contacts = await progressive_agent_db.get_agent_contacts(agent_id=agent_id, offset=offset, limit=limit)
         return {"success": True, "data": contacts, "count": len(contacts)}
     except Exception as e:
         logger.error(f"Error getting agent contacts: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/leads/agent/{agent_id}/campaigns")
-async def get_agent_campaigns(agent_id: str, limit: int = 100):
+async def get_agent_campaigns(agent_id: str, limit: int = 100, offset: int = 0):
     """Get campaigns for a specific agent"""
     try:
-        campaigns = await progressive_agent_db.get_agent_campaigns(agent_id=agent_id, limit=limit)
+        campaigns = await progressive_agent_db.get_agent_campaigns(agent_id=agent_id, offset=offset, limit=limit)
         return {"success": True, "data": campaigns, "count": len(campaigns)}
     except Exception as e:
         logger.error(f"Error getting agent campaigns: {e}")
@@ -68,7 +68,7 @@ async def create_progressive_agent(request: JobSearchRequest, background_tasks:
 async def get_progressive_agent_status(agent_id: str):
     """Get current status and results for a progressive agent"""
     try:
-        agent = progressive_agent_manager.get_agent(agent_id)
+        agent = await progressive_agent_manager.load_agent(agent_id)
         if not agent:
             raise HTTPException(status_code=404, detail="Agent not found")
         
@@ -160,7 +160,7 @@ async def run_linkedin_stage(agent_id: str, query: str, hours_old: int):
         )
         
         # Add results
-        progressive_agent_manager.add_stage_results(
+        await progressive_agent_manager.add_stage_results(
             agent_id, "linkedin_fetch", linkedin_jobs_only, "linkedin_jobs"
         )
         
@@ -309,7 +309,7 @@ async def run_other_boards_stage(agent_id: str, request: JobSearchRequest):
         )
         
         # Add results
-        progressive_agent_manager.add_stage_results(
+        await progressive_agent_manager.add_stage_results(
             agent_id, "other_boards", other_jobs, "other_jobs"
         )
         
@@ -391,7 +391,7 @@ async def run_contact_enrichment_stage(agent_id: str):
         )
         
         # Add results
-        progressive_agent_manager.add_stage_results(
+        await progressive_agent_manager.add_stage_results(
             agent_id, "contact_enrichment", all_contacts, "contacts"
         )
         
@@ -469,7 +469,7 @@ async def run_campaign_creation_stage(agent_id: str, request: JobSearchRequest):
         )
         
         # Add results
-        progressive_agent_manager.add_stage_results(
+        await progressive_agent_manager.add_stage_results(
             agent_id, "campaign_creation", campaigns, "campaigns"
         )
         
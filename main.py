@@ -65,6 +65,24 @@ app.include_router(progressive_agents.router)
 app.include_router(email.router)
 app.include_router(quota_management.router)
 
+@app.on_event("startup")
+async def start_background_writers():
+    """Start the worker that persists progressive agent results and load the email suppression list"""
+    from utils.progressive_agent_manager import progressive_agent_manager
+    from utils.ses_manager import load_suppression_list
+    progressive_agent_manager.start_outbox_worker()
+    await load_suppression_list()
+
+@app.on_event("shutdown")
+async def flush_pending_writes():
+    """Flush buffered progressive agent rows and close database pools and HTTP clients before the process exits"""
+    from utils.progressive_agent_manager import progressive_agent_manager
+    from utils.progressive_agent_db import progressive_agent_db
+    from utils.smartlead_manager import close_client as close_smartlead_client
+    await progressive_agent_manager.drain_outbox()
+    await progressive_agent_db.close()
+    await close_smartlead_client()
+
 # Serve HTML templates
 @app.get("/login", response_class=HTMLResponse)
 async def get_login():
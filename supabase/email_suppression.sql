@@ -0,0 +1,11 @@
+-- Email suppression list
+-- Addresses that hard-bounced or complained via SES; sends to these are skipped
+
+CREATE TABLE IF NOT EXISTS email_suppression (
+    email TEXT PRIMARY KEY,
+    reason TEXT NOT NULL,
+    detail TEXT,
+    created_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+GRANT SELECT, INSERT ON email_suppression TO service_role;
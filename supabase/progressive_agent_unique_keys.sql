@@ -0,0 +1,23 @@
+-- Unique record keys for progressive agent jobs and contacts
+-- The API assigns each record a uuid once and upserts with ON CONFLICT DO NOTHING on it,
+-- so retried batches are idempotent. Scraped job/contact ids are not unique, so they can't be the key.
+
+-- Drop the earlier (agent_id, job_id/contact_id) keys if they were applied
+ALTER TABLE progressive_agent_jobs DROP CONSTRAINT IF EXISTS progressive_agent_jobs_agent_job_key;
+ALTER TABLE progressive_agent_contacts DROP CONSTRAINT IF EXISTS progressive_agent_contacts_agent_contact_key;
+
+-- Existing rows each get their own uuid from the default
+ALTER TABLE progressive_agent_jobs
+ADD COLUMN IF NOT EXISTS record_key UUID NOT NULL DEFAULT gen_random_uuid();
+
+ALTER TABLE progressive_agent_contacts
+ADD COLUMN IF NOT EXISTS record_key UUID NOT NULL DEFAULT gen_random_uuid();
+
+-- Add the unique constraints used as conflict targets
+ALTER TABLE progressive_agent_jobs DROP CONSTRAINT IF EXISTS progressive_agent_jobs_record_key_key;
+ALTER TABLE progressive_agent_jobs
+ADD CONSTRAINT progressive_agent_jobs_record_key_key UNIQUE (record_key);
+
+ALTER TABLE progressive_agent_contacts DROP CONSTRAINT IF EXISTS progressive_agent_contacts_record_key_key;
+ALTER TABLE progressive_agent_contacts
+ADD CONSTRAINT progressive_agent_contacts_record_key_key UNIQUE (record_key);
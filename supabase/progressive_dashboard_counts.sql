@@ -0,0 +1,25 @@
+-- Dashboard counters for progressive agents
+-- Precomputes the dashboard totals so the API reads one row instead of running four count(*) scans
+
+-- Create the materialized view with a single row of counts
+CREATE MATERIALIZED VIEW IF NOT EXISTS progressive_dashboard_counts AS
+SELECT
+    1 AS id,
+    (SELECT count(*) FROM progressive_agent_jobs) AS total_jobs,
+    (SELECT count(*) FROM progressive_agent_contacts) AS total_contacts,
+    (SELECT count(*) FROM progressive_agent_campaigns) AS total_campaigns,
+    (SELECT count(*) FROM progressive_agents WHERE status <> 'completed') AS active_agents;
+
+-- Unique index is required for REFRESH ... CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS idx_progressive_dashboard_counts_id ON progressive_dashboard_counts(id);
+
+-- Expose the view through the API
+GRANT SELECT ON progressive_dashboard_counts TO anon, authenticated, service_role;
+
+-- Refresh every 30 seconds with pg_cron
+CREATE EXTENSION IF NOT EXISTS pg_cron;
+SELECT cron.schedule(
+    'refresh-progressive-dashboard-counts',
+    '30 seconds',
+    'REFRESH MATERIALIZED VIEW CONCURRENTLY progressive_dashboard_counts'
+);
@@ -0,0 +1,27 @@
+-- Limit progressive agent job descriptions to 1000 characters in the database
+-- The API sends descriptions as-is and relies on this trigger to truncate them
+
+-- Truncate any descriptions already stored
+UPDATE progressive_agent_jobs
+SET description = left(description, 1000)
+WHERE char_length(description) > 1000;
+
+-- Truncate incoming descriptions (runs before the CHECK below is evaluated)
+CREATE OR REPLACE FUNCTION truncate_progressive_job_description()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.description := left(NEW.description, 1000);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_truncate_progressive_job_description ON progressive_agent_jobs;
+CREATE TRIGGER trg_truncate_progressive_job_description
+    BEFORE INSERT OR UPDATE OF description ON progressive_agent_jobs
+    FOR EACH ROW
+    EXECUTE FUNCTION truncate_progressive_job_description();
+
+-- Enforce the limit; a VARCHAR(1000) column would reject long values before the trigger could run
+ALTER TABLE progressive_agent_jobs DROP CONSTRAINT IF EXISTS progressive_agent_jobs_description_length;
+ALTER TABLE progressive_agent_jobs
+ADD CONSTRAINT progressive_agent_jobs_description_length CHECK (char_length(description) <= 1000);
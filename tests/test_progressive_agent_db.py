@@ -0,0 +1,76 @@
+"""
+Tests for the progressive agent batch writer
+"""
+import asyncio
+
+from utils import progressive_agent_db
+
+
+def test_batch_writer_survives_pool_open_failure(monkeypatch):
+    """A failing pool open falls back to PostgREST and the drain loop keeps running"""
+    written = []
+    pool_calls = []
+
+    async def fake_get_client():
+        return object()
+
+    async def flaky_get_pool():
+        pool_calls.append(1)
+        if len(pool_calls) == 1:
+            raise OSError("could not connect to server")
+        return None
+
+    async def fake_write_rows(self, supabase, pool, table, rows):
+        assert pool is None
+        written.extend(rows)
+
+    monkeypatch.setattr(progressive_agent_db, "get_client", fake_get_client)
+    monkeypatch.setattr(progressive_agent_db, "get_pool", flaky_get_pool)
+    monkeypatch.setattr(progressive_agent_db._AsyncBatchWriter, "FLUSH_INTERVAL", 0.01)
+    monkeypatch.setattr(progressive_agent_db._AsyncBatchWriter, "_write_rows", fake_write_rows)
+
+    async def run():
+        writer = progressive_agent_db._AsyncBatchWriter()
+        await writer.enqueue("progressive_agent_jobs", [{"agent_id": "a", "n": 1}])
+        await asyncio.wait_for(writer.drain(), timeout=5)
+
+        await writer.enqueue("progressive_agent_jobs", [{"agent_id": "a", "n": 2}])
+        await asyncio.wait_for(writer.drain(), timeout=5)
+
+        task = writer._tasks["progressive_agent_jobs"]
+        assert not task.done()
+        task.cancel()
+
+    asyncio.run(run())
+
+    assert [row["n"] for row in written] == [1, 2]
+    assert len(pool_calls) == 2
+
+
+def test_batch_writer_survives_unexpected_write_error(monkeypatch):
+    """An exception escaping _write drops only that batch, not the drain loop"""
+    calls = []
+
+    async def exploding_write(self, table, batch):
+        calls.append(batch)
+        if len(calls) == 1:
+            raise RuntimeError("client init failed")
+
+    monkeypatch.setattr(progressive_agent_db._AsyncBatchWriter, "FLUSH_INTERVAL", 0.01)
+    monkeypatch.setattr(progressive_agent_db._AsyncBatchWriter, "_write", exploding_write)
+
+    async def run():
+        writer = progressive_agent_db._AsyncBatchWriter()
+        await writer.enqueue("progressive_agent_contacts", [{"agent_id": "a"}])
+        await asyncio.wait_for(writer.drain(), timeout=5)
+
+        await writer.enqueue("progressive_agent_contacts", [{"agent_id": "b"}])
+        await asyncio.wait_for(writer.drain(), timeout=5)
+
+        task = writer._tasks["progressive_agent_contacts"]
+        assert not task.done()
+        task.cancel()
+
+    asyncio.run(run())
+
+    assert [batch[0]["agent_id"] for batch in calls] == ["a", "b"]
@@ -369,7 +369,7 @@ P.S. This is a confidential search, so your current employer won't be contacted
             # Create campaign using SmartLead manager
             logger.info(f"🚀 Creating SmartLead.ai campaign: {campaign_name} with {len(smartlead_leads)} leads")
             
-            result = self.smartlead_manager.create_campaign(
+            result = await self.smartlead_manager.create_campaign(
                 name=campaign_name,
                 leads=smartlead_leads,
                 email_template=message,
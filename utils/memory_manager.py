@@ -1,22 +1,32 @@
 import os
 import logging
 import json
+import hashlib
+from itertools import islice
 from typing import Dict, Any, List
 from datetime import datetime
 
+# Use faster JSON encoder/decoder if available
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 class MemoryManager:
     def __init__(self):
-        self.memory_file = "memory.json"
+        self.memory_file = os.getenv("MEMORY_FILE", "memory.json")
         self.data = self._load_memory()
         
     def _load_memory(self) -> Dict[str, Any]:
         """Load memory from file"""
         try:
-            if os.path.exists(self.memory_file):
-                with open(self.memory_file, 'r') as f:
-                    return json.load(f)
+            with open(self.memory_file, 'rb') as f:
+                raw = f.read()
+            return orjson.loads(raw) if orjson else json.loads(raw)
+        except FileNotFoundError:
+            pass
         except Exception as e:
             logger.warning(f"Could not load memory: {e}")
         return {
@@ -32,8 +42,12 @@ class MemoryManager:
     def _save_memory(self):
         """Save memory to file"""
         try:
-            with open(self.memory_file, 'w') as f:
-                json.dump(self.data, f, indent=2)
+            if orjson:
+                with open(self.memory_file, 'wb') as f:
+                    f.write(orjson.dumps(self.data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(self.memory_file, 'w') as f:
+                    json.dump(self.data, f, indent=2)
         except Exception as e:
             logger.error(f"Could not save memory: {e}")
             
@@ -53,8 +67,7 @@ class MemoryManager:
         
     def get_all_batches(self, limit: int = 10, offset: int = 0) -> List[Dict[str, Any]]:
         """Get all batches with pagination"""
-        batches = list(self.data["batches"].values())
-        return batches[offset:offset + limit]
+        return list(islice(self.data["batches"].values(), offset, offset + limit))
         
     def store_company(self, company_name: str, company_data: Dict[str, Any]):
         """Store company data"""
@@ -75,9 +88,11 @@ class MemoryManager:
         
     def create_job_fingerprint(self, job: Dict[str, Any]) -> str:
         """Create a unique fingerprint for a job"""
-        # Create a unique identifier based on job title, company, and URL
-        job_id = f"{job.get('title', '')}-{job.get('company', '')}-{job.get('job_url', '')}"
-        return job_id
+        # Hash job title, company, and URL into a fixed-width 16-char key;
+        # the unit separator keeps "AB"+"C" from colliding with "A"+"BC"
+        # Always blake2b from the stdlib, so every host produces the same keys
+        key = f"{job.get('title', '')}\x1f{job.get('company', '')}\x1f{job.get('job_url', '')}"
+        return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
         
     def is_job_processed(self, job_fingerprint: str) -> bool:
         """Check if a job has already been processed"""
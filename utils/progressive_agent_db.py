@@ -2,17 +2,63 @@
 Progressive Agent Database Manager - Handles persistence of agent results to Supabase
 """
 import os
+import asyncio
 import logging
+import time
+import uuid
 from datetime import datetime
 from typing import Dict, List, Any, Optional
-from supabase import create_client, Client
+import httpx
+from cachetools import TTLCache
+from supabase import acreate_client, AsyncClient, AsyncClientOptions
 from dotenv import load_dotenv
 
+# Direct Postgres access is optional and only used for bulk COPY loads
+try:
+    import psycopg
+    from psycopg import sql
+    from psycopg_pool import AsyncConnectionPool
+except ImportError:
+    psycopg = None
+
 # Load environment variables
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+class _ErrorRateLimitFilter(logging.Filter):
+    """Let each error message template and first argument through at most once per interval"""
+    
+    def __init__(self, interval: float = 1.0, maxsize: int = 1024):
+        super().__init__()
+        # Bounded and expiring, so distinct messages can't grow the map forever
+        self._recent: TTLCache = TTLCache(maxsize=maxsize, ttl=interval)
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno < logging.ERROR:
+            return True
+        # Key on the first argument too, so one agent's failure doesn't hide another's
+        first_arg = record.args[0] if isinstance(record.args, tuple) and record.args else None
+        key = (record.name, str(record.msg), str(first_arg))
+        if key in self._recent:
+            return False
+        self._recent[key] = True
+        return True
+
+# Keep failure storms (e.g. a bad column on every batch) from flooding the logs
+logger.addFilter(_ErrorRateLimitFilter())
+
+# Formatted timestamp reused for every call within the same second
+_now_iso_cache: Dict[str, Any] = {"second": 0, "iso": ""}
+
+def now_iso() -> str:
+    """Current local time as an ISO string, formatted at most once per second"""
+    second = int(time.time())
+    if second != _now_iso_cache["second"]:
+        _now_iso_cache["second"] = second
+        _now_iso_cache["iso"] = datetime.fromtimestamp(second).isoformat()
+    return _now_iso_cache["iso"]
+
 # Initialize Supabase client
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_SERVICE_ROLE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
@@ -21,23 +67,284 @@ SUPABASE_ANON_KEY = os.getenv("SUPABASE_ANON_KEY")
 # Use service role key for write operations, fallback to anon key
 SUPABASE_KEY = SUPABASE_SERVICE_ROLE_KEY or SUPABASE_ANON_KEY
 
-if SUPABASE_URL and SUPABASE_KEY:
-    supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
-    key_type = "SERVICE_ROLE" if SUPABASE_SERVICE_ROLE_KEY else "ANON"
-    logger.info(f"✅ Supabase client initialized for progressive agents (using {key_type} key)")
-else:
-    supabase = None
+if not (SUPABASE_URL and SUPABASE_KEY):
     logger.warning("❌ Supabase credentials not found - database persistence disabled")
 
+# Session-mode pooler connection string for bulk loads that bypass PostgREST
+SUPABASE_DB_URL = os.getenv("SUPABASE_DB_URL")
+COPY_THRESHOLD = int(os.getenv("PROGRESSIVE_COPY_THRESHOLD", "2000"))  # rows
+
+# Auth headers built once and sent as defaults on every request
+_HEADERS = {
+    "apikey": SUPABASE_KEY or "",
+    "Authorization": f"Bearer {SUPABASE_KEY}",
+    "Content-Type": "application/json"
+}
+
+# Conflict targets for tables whose writes must be idempotent across retries; record_key
+# is a uuid assigned once per record, since scraped job and contact ids aren't unique
+_CONFLICT_KEYS = {
+    "progressive_agent_jobs": "record_key",
+    "progressive_agent_contacts": "record_key"
+}
+
+# Async client is created lazily on first use since it must be built inside the event loop
+_client: Optional[AsyncClient] = None
+_client_lock = asyncio.Lock()
+
+async def get_client() -> Optional[AsyncClient]:
+    """Get the shared async Supabase client, creating it on first use"""
+    global _client
+    if _client is not None or not (SUPABASE_URL and SUPABASE_KEY):
+        return _client
+    
+    async with _client_lock:
+        if _client is None:
+            # One pooled HTTP/2 connection set shared by every PostgREST call
+            http_client = httpx.AsyncClient(
+                headers=_HEADERS,
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=20),
+                timeout=120
+            )
+            _client = await acreate_client(
+                SUPABASE_URL,
+                SUPABASE_KEY,
+                options=AsyncClientOptions(httpx_client=http_client)
+            )
+            key_type = "SERVICE_ROLE" if SUPABASE_SERVICE_ROLE_KEY else "ANON"
+            logger.info(f"✅ Supabase client initialized for progressive agents (using {key_type} key)")
+    return _client
+
+# Small pool sized for Supabase's shared pooler connection limits
+_pool: Optional["AsyncConnectionPool"] = None
+_pool_lock = asyncio.Lock()
+
+async def get_pool() -> Optional["AsyncConnectionPool"]:
+    """Get the shared direct Postgres pool, opening it on first use"""
+    global _pool
+    if _pool is not None or psycopg is None or not SUPABASE_DB_URL:
+        return _pool
+    
+    async with _pool_lock:
+        if _pool is None:
+            pool = AsyncConnectionPool(
+                SUPABASE_DB_URL,
+                min_size=2,
+                max_size=5,
+                max_idle=1800,
+                timeout=30,
+                # Prepared statements are disabled since the Supabase pooler does not support them
+                kwargs={"prepare_threshold": None},
+                open=False
+            )
+            try:
+                await pool.open()
+            except Exception:
+                await pool.close()
+                raise
+            _pool = pool
+            logger.info("✅ Direct Postgres pool opened for bulk loads")
+    return _pool
+
+async def close_pool():
+    """Close the direct Postgres pool if it was opened"""
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
+
+class _AsyncBatchWriter:
+    """Buffers rows per table and writes them to Supabase in large batched inserts or upserts"""
+    
+    MAX_BATCH = 5000  # rows per insert
+    FLUSH_INTERVAL = 0.5  # seconds to wait for more rows before flushing
+    MAX_RETRIES = 3
+    MAX_SALVAGE_WRITES = 64  # smaller writes allowed when splitting a failed batch
+    
+    def __init__(self):
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+    
+    async def enqueue(self, table: str, rows: List[Dict[str, Any]]):
+        """Queue rows for the next batched insert into a table"""
+        if not rows:
+            return
+        
+        queue = self._queues.get(table)
+        if queue is None:
+            queue = self._queues[table] = asyncio.Queue()
+        task = self._tasks.get(table)
+        if task is None or task.done():
+            # Restart the drain loop if it ever stopped so rows can't pile up unwritten
+            self._tasks[table] = asyncio.create_task(self._drain_loop(table, queue))
+        await queue.put(rows)
+    
+    async def drain(self):
+        """Wait until every queued row has been written"""
+        await asyncio.gather(*(queue.join() for queue in self._queues.values()))
+    
+    async def _drain_loop(self, table: str, queue: asyncio.Queue):
+        """Collect queued rows for up to FLUSH_INTERVAL or MAX_BATCH rows, then write them"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = list(await queue.get())
+            taken = 1
+            deadline = loop.time() + self.FLUSH_INTERVAL
+            
+            while len(batch) < self.MAX_BATCH:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.extend(await asyncio.wait_for(queue.get(), timeout=timeout))
+                    taken += 1
+                except asyncio.TimeoutError:
+                    break
+            
+            try:
+                await self._write(table, batch)
+            except Exception:
+                # Keep draining; an unexpected failure only costs this batch
+                logger.exception("❌ Dropping batch of %s rows for %s", len(batch), table)
+            finally:
+                for _ in range(taken):
+                    queue.task_done()
+    
+    async def _write(self, table: str, batch: List[Dict[str, Any]]):
+        """Insert a batch, retrying with exponential backoff, then salvaging what it can on failure"""
+        supabase = await get_client()
+        if not supabase:
+            return
+        
+        try:
+            pool = await get_pool()
+        except Exception as e:
+            # Fall back to PostgREST; the pool is retried on the next batch
+            logger.warning(f"⚠️ Direct Postgres pool unavailable, writing {table} through PostgREST: {e}")
+            pool = None
+        
+        for start in range(0, len(batch), self.MAX_BATCH):
+            rows = batch[start:start + self.MAX_BATCH]
+            for attempt in range(self.MAX_RETRIES):
+                try:
+                    await self._write_rows(supabase, pool, table, rows)
+                    logger.info(f"✅ Saved {len(rows)} rows to {table}")
+                    break
+                except Exception as e:
+                    if attempt == self.MAX_RETRIES - 1:
+                        logger.warning(f"⚠️ Batch of {len(rows)} rows for {table} failed {self.MAX_RETRIES} times, retrying in smaller pieces: {e}")
+                        saved = await self._salvage(supabase, pool, table, rows, e, [self.MAX_SALVAGE_WRITES])
+                        logger.info(f"✅ Salvaged {saved} of {len(rows)} rows for {table}")
+                    else:
+                        delay = 0.5 * 2 ** attempt
+                        logger.warning(f"⚠️ Batch insert into {table} failed, retrying in {delay}s: {e}")
+                        await asyncio.sleep(delay)
+    
+    async def _salvage(self, supabase: AsyncClient, pool: Optional["AsyncConnectionPool"], table: str, rows: List[Dict[str, Any]], error: Exception, budget: List[int]) -> int:
+        """Rewrite failed rows per agent, then in halves, so only the bad rows are dropped"""
+        if len(rows) == 1 or budget[0] <= 0:
+            logger.error(f"❌ Dropping {len(rows)} rows for {table} (agent {rows[0].get('agent_id')}): {error}")
+            return 0
+        
+        by_agent: Dict[Any, List[Dict[str, Any]]] = {}
+        for row in rows:
+            by_agent.setdefault(row.get("agent_id"), []).append(row)
+        if len(by_agent) > 1:
+            parts = list(by_agent.values())
+        else:
+            middle = len(rows) // 2
+            parts = [rows[:middle], rows[middle:]]
+        
+        saved = 0
+        for part in parts:
+            budget[0] -= 1
+            try:
+                await self._write_rows(supabase, pool, table, part)
+                saved += len(part)
+            except Exception as e:
+                saved += await self._salvage(supabase, pool, table, part, e, budget)
+        return saved
+    
+    async def _write_rows(self, supabase: AsyncClient, pool: Optional["AsyncConnectionPool"], table: str, rows: List[Dict[str, Any]]):
+        """Write rows in a single COPY, upsert or insert"""
+        if pool is not None and len(rows) >= COPY_THRESHOLD:
+            # Large loads stream straight into Postgres instead of PostgREST JSON
+            await self._copy_rows(pool, table, rows)
+        elif table in _CONFLICT_KEYS:
+            # Rows that already exist are skipped so one duplicate can't fail the batch
+            await supabase.table(table).upsert(
+                rows,
+                on_conflict=_CONFLICT_KEYS[table],
+                ignore_duplicates=True,
+                returning="minimal"
+            ).execute()
+        else:
+            # Skip echoing inserted rows back; only success matters here
+            await supabase.table(table).insert(rows, returning="minimal").execute()
+    
+    async def _copy_rows(self, pool: "AsyncConnectionPool", table: str, rows: List[Dict[str, Any]]):
+        """Stream rows into a table with COPY over a pooled Postgres connection"""
+        columns = list(rows[0])
+        column_list = sql.SQL(", ").join(map(sql.Identifier, columns))
+        conflict_key = _CONFLICT_KEYS.get(table)
+        
+        async with pool.connection() as conn:
+            async with conn.transaction():
+                async with conn.cursor() as cur:
+                    if conflict_key is None:
+                        target = sql.Identifier(table)
+                    else:
+                        # COPY can't skip conflicts, so stage the rows and merge them with ON CONFLICT DO NOTHING
+                        target = sql.Identifier(f"{table}_staging")
+                        await cur.execute(sql.SQL(
+                            "CREATE TEMP TABLE {} (LIKE {} INCLUDING DEFAULTS) ON COMMIT DROP"
+                        ).format(target, sql.Identifier(table)))
+                    
+                    async with cur.copy(sql.SQL("COPY {} ({}) FROM STDIN").format(target, column_list)) as copy:
+                        for row in rows:
+                            await copy.write_row([row[column] for column in columns])
+                    
+                    if conflict_key is not None:
+                        await cur.execute(sql.SQL(
+                            "INSERT INTO {} ({}) SELECT {} FROM {} ON CONFLICT ({}) DO NOTHING"
+                        ).format(
+                            sql.Identifier(table),
+                            column_list,
+                            column_list,
+                            target,
+                            sql.SQL(", ").join(map(sql.Identifier, conflict_key.split(",")))
+                        ))
+
+# Shared writer so rows from concurrent agents are batched together
+_batch_writer = _AsyncBatchWriter()
+
+# Job list columns; the long description is only fetched when asked for
+JOB_LIST_FIELDS = (
+    "id,agent_id,job_id,title,company,location,url,posted_date,employment_type,"
+    "experience_level,salary,site,company_url,is_remote,skills,is_demo,scraped_at,created_at"
+)
+
+# Short-lived cache for dashboard stats
+DASHBOARD_CACHE_TTL = 5  # seconds
+_dashboard_cache: Dict[str, Any] = {"stats": None, "expires_at": 0.0}
+
 class ProgressiveAgentDB:
     """Manages database operations for progressive agents"""
     
-    def __init__(self):
-        self.supabase = supabase
+    async def flush(self):
+        """Wait for all buffered job, contact and campaign rows to be written"""
+        await _batch_writer.drain()
+    
+    async def close(self):
+        """Flush buffered rows and release direct database connections"""
+        await self.flush()
+        await close_pool()
     
     async def save_agent_metadata(self, agent_id: str, query: str, status: str, **kwargs):
-        """Save or update agent metadata"""
-        if not self.supabase:
+        """Save or update agent metadata in a single upsert"""
+        supabase = await get_client()
+        if not supabase:
             logger.warning("No Supabase client - skipping agent metadata save")
             return
         
@@ -46,29 +353,24 @@ class ProgressiveAgentDB:
                 "agent_id": agent_id,
                 "query": query,
                 "status": status,
-                "updated_at": datetime.now().isoformat(),
+                "updated_at": now_iso(),
                 **kwargs
             }
             
-            # Try to update first, if not exists then insert
-            result = self.supabase.table("progressive_agents").select("id").eq("agent_id", agent_id).execute()
-            
-            if result.data:
-                # Update existing
-                self.supabase.table("progressive_agents").update(agent_data).eq("agent_id", agent_id).execute()
-                logger.info(f"📊 Updated agent metadata: {agent_id}")
-            else:
-                # Insert new
-                agent_data["created_at"] = datetime.now().isoformat()
-                self.supabase.table("progressive_agents").insert(agent_data).execute()
-                logger.info(f"📊 Created agent metadata: {agent_id}")
+            # Single upsert keyed on the unique agent_id; created_at is left to the
+            # column default so updates keep the original creation time
+            await supabase.table("progressive_agents").upsert(
+                agent_data, on_conflict="agent_id", returning="minimal"
+            ).execute()
+            logger.info(f"📊 Saved agent metadata: {agent_id}")
                 
         except Exception as e:
             logger.error(f"❌ Error saving agent metadata for {agent_id}: {e}")
     
     async def save_jobs(self, agent_id: str, jobs: List[Dict[str, Any]]):
         """Save jobs to database"""
-        if not self.supabase:
+        supabase = await get_client()
+        if not supabase:
             logger.warning("No Supabase client - skipping job save")
             return
             
@@ -77,16 +379,17 @@ class ProgressiveAgentDB:
             return
         
         try:
-            job_records = []
-            for job in jobs:
-                job_record = {
+            created_at = now_iso()
+            job_records = [
+                {
+                    "record_key": str(uuid.uuid4()),
                     "agent_id": agent_id,
                     "job_id": job.get("id"),
                     "title": job.get("title", ""),
                     "company": job.get("company", ""),
                     "location": job.get("location"),
                     "url": job.get("url"),
-                    "description": job.get("description", "")[:1000],  # Truncate for db
+                    "description": job.get("description", ""),  # Truncated to 1000 chars by a DB trigger
                     "posted_date": job.get("posted_date"),
                     "employment_type": job.get("employment_type"),
                     "experience_level": job.get("experience_level"),
@@ -96,29 +399,23 @@ class ProgressiveAgentDB:
                     "is_remote": job.get("is_remote", False),
                     "skills": job.get("skills", []),
                     "is_demo": job.get("is_demo", False),
-                    "scraped_at": job.get("scraped_at", datetime.now().isoformat()),
-                    "created_at": datetime.now().isoformat()
+                    "scraped_at": job.get("scraped_at") or created_at,
+                    "created_at": created_at
                 }
-                job_records.append(job_record)
+                for job in jobs
+            ]
             
-            # Batch insert jobs
-            logger.info(f"💼 Attempting to save {len(job_records)} jobs for agent {agent_id}")
-            result = self.supabase.table("progressive_agent_jobs").insert(job_records).execute()
+            # Queue for the shared batched insert
+            logger.info(f"💼 Queued {len(job_records)} jobs for agent {agent_id}")
+            await _batch_writer.enqueue("progressive_agent_jobs", job_records)
             
-            if result.data:
-                logger.info(f"✅ Successfully saved {len(result.data)} jobs for agent {agent_id}")
-            else:
-                logger.warning(f"⚠️ No data returned after saving jobs for agent {agent_id}")
-            
-        except Exception as e:
-            logger.error(f"❌ Error saving jobs for agent {agent_id}: {e}")
-            logger.error(f"   First job sample: {jobs[0] if jobs else 'No jobs'}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("❌ Error saving jobs for agent %s (first job: %s)", agent_id, jobs[0] if jobs else None)
     
     async def save_contacts(self, agent_id: str, contacts: List[Dict[str, Any]]):
         """Save contacts to database"""
-        if not self.supabase:
+        supabase = await get_client()
+        if not supabase:
             logger.warning("No Supabase client - skipping contact save")
             return
             
@@ -127,9 +424,10 @@ class ProgressiveAgentDB:
             return
         
         try:
-            contact_records = []
-            for contact in contacts:
-                contact_record = {
+            created_at = now_iso()
+            contact_records = [
+                {
+                    "record_key": str(uuid.uuid4()),
                     "agent_id": agent_id,
                     "contact_id": contact.get("id"),
                     "name": contact.get("name"),
@@ -144,34 +442,28 @@ class ProgressiveAgentDB:
                     "verified": bool(contact.get("email")),
                     "source": contact.get("source", "Hunter"),
                     "confidence_score": contact.get("confidence_score"),
-                    "created_at": datetime.now().isoformat()
+                    "created_at": created_at
                 }
-                contact_records.append(contact_record)
+                for contact in contacts
+            ]
             
-            # Batch insert contacts
-            logger.info(f"👥 Attempting to save {len(contact_records)} contacts for agent {agent_id}")
-            result = self.supabase.table("progressive_agent_contacts").insert(contact_records).execute()
-            
-            if result.data:
-                logger.info(f"✅ Successfully saved {len(result.data)} contacts for agent {agent_id}")
-            else:
-                logger.warning(f"⚠️ No data returned after saving contacts for agent {agent_id}")
+            # Queue for the shared batched insert
+            logger.info(f"👥 Queued {len(contact_records)} contacts for agent {agent_id}")
+            await _batch_writer.enqueue("progressive_agent_contacts", contact_records)
             
-        except Exception as e:
-            logger.error(f"❌ Error saving contacts for agent {agent_id}: {e}")
-            logger.error(f"   First contact sample: {contacts[0] if contacts else 'No contacts'}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("❌ Error saving contacts for agent %s (first contact: %s)", agent_id, contacts[0] if contacts else None)
     
     async def save_campaigns(self, agent_id: str, campaigns: List[Dict[str, Any]]):
         """Save campaigns to database"""
-        if not self.supabase or not campaigns:
+        supabase = await get_client()
+        if not supabase or not campaigns:
             return
         
         try:
-            campaign_records = []
-            for campaign in campaigns:
-                campaign_record = {
+            created_at = now_iso()
+            campaign_records = [
+                {
                     "agent_id": agent_id,
                     "campaign_id": campaign.get("id"),
                     "name": campaign.get("name", ""),
@@ -184,79 +476,98 @@ class ProgressiveAgentDB:
                     "open_count": campaign.get("open_count", 0),
                     "reply_count": campaign.get("reply_count", 0),
                     "platform": campaign.get("platform", "Instantly"),
-                    "created_at": datetime.now().isoformat(),
-                    "updated_at": datetime.now().isoformat()
+                    "created_at": created_at,
+                    "updated_at": created_at
                 }
-                campaign_records.append(campaign_record)
+                for campaign in campaigns
+            ]
             
-            # Batch insert campaigns
-            self.supabase.table("progressive_agent_campaigns").insert(campaign_records).execute()
-            logger.info(f"📧 Saved {len(campaign_records)} campaigns for agent {agent_id}")
+            # Queue for the shared batched insert
+            await _batch_writer.enqueue("progressive_agent_campaigns", campaign_records)
+            logger.info(f"📧 Queued {len(campaign_records)} campaigns for agent {agent_id}")
             
         except Exception as e:
             logger.error(f"❌ Error saving campaigns for agent {agent_id}: {e}")
     
-    async def get_agent_jobs(self, agent_id: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
-        """Get jobs from database"""
-        if not self.supabase:
+    async def get_agent_jobs(self, agent_id: Optional[str] = None, offset: int = 0, limit: int = 100, fields: str = JOB_LIST_FIELDS) -> List[Dict[str, Any]]:
+        """Get a page of jobs from database, newest first"""
+        supabase = await get_client()
+        if not supabase:
             return []
         
         try:
-            query = self.supabase.table("progressive_agent_jobs").select("*").order("created_at", desc=True).limit(limit)
+            query = supabase.table("progressive_agent_jobs").select(fields).order("created_at", desc=True).order("id", desc=True).range(offset, offset + limit - 1)
             
             if agent_id:
                 query = query.eq("agent_id", agent_id)
             
-            result = query.execute()
+            result = await query.execute()
             return result.data or []
             
         except Exception as e:
             logger.error(f"❌ Error getting jobs: {e}")
             return []
     
-    async def get_agent_contacts(self, agent_id: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
-        """Get contacts from database"""
-        if not self.supabase:
+    async def get_agent_contacts(self, agent_id: Optional[str] = None, offset: int = 0, limit: int = 100, fields: str = "*") -> List[Dict[str, Any]]:
+        """Get a page of contacts from database, newest first"""
+        supabase = await get_client()
+        if not supabase:
             return []
         
         try:
-            query = self.supabase.table("progressive_agent_contacts").select("*").order("created_at", desc=True).limit(limit)
+            query = supabase.table("progressive_agent_contacts").select(fields).order("created_at", desc=True).order("id", desc=True).range(offset, offset + limit - 1)
             
             if agent_id:
                 query = query.eq("agent_id", agent_id)
             
-            result = query.execute()
+            result = await query.execute()
             return result.data or []
             
         except Exception as e:
             logger.error(f"❌ Error getting contacts: {e}")
             return []
     
-    async def get_agent_campaigns(self, agent_id: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
-        """Get campaigns from database"""
-        if not self.supabase:
+    async def get_agent_campaigns(self, agent_id: Optional[str] = None, offset: int = 0, limit: int = 100, fields: str = "*") -> List[Dict[str, Any]]:
+        """Get a page of campaigns from database, newest first"""
+        supabase = await get_client()
+        if not supabase:
             return []
         
         try:
-            query = self.supabase.table("progressive_agent_campaigns").select("*").order("created_at", desc=True).limit(limit)
+            query = supabase.table("progressive_agent_campaigns").select(fields).order("created_at", desc=True).order("id", desc=True).range(offset, offset + limit - 1)
             
             if agent_id:
                 query = query.eq("agent_id", agent_id)
             
-            result = query.execute()
+            result = await query.execute()
             return result.data or []
             
         except Exception as e:
             logger.error(f"❌ Error getting campaigns: {e}")
             return []
     
+    async def get_agent(self, agent_id: str) -> Optional[Dict[str, Any]]:
+        """Get a single progressive agent's metadata row"""
+        supabase = await get_client()
+        if not supabase:
+            return None
+        
+        try:
+            result = await supabase.table("progressive_agents").select("*").eq("agent_id", agent_id).limit(1).execute()
+            return result.data[0] if result.data else None
+            
+        except Exception as e:
+            logger.error(f"❌ Error getting agent {agent_id}: {e}")
+            return None
+    
     async def get_all_agents(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Get all progressive agents"""
-        if not self.supabase:
+        supabase = await get_client()
+        if not supabase:
             return []
         
         try:
-            result = self.supabase.table("progressive_agents").select("*").order("created_at", desc=True).limit(limit).execute()
+            result = await supabase.table("progressive_agents").select("*").order("created_at", desc=True).limit(limit).execute()
             return result.data or []
             
         except Exception as e:
@@ -264,27 +575,53 @@ class ProgressiveAgentDB:
             return []
     
     async def get_dashboard_stats(self) -> Dict[str, Any]:
-        """Get dashboard statistics"""
-        if not self.supabase:
+        """Get dashboard statistics, cached briefly to absorb dashboard polling"""
+        now = time.monotonic()
+        if _dashboard_cache["stats"] is not None and now < _dashboard_cache["expires_at"]:
+            return _dashboard_cache["stats"]
+        
+        supabase = await get_client()
+        if not supabase:
             return {"total_jobs": 0, "total_contacts": 0, "total_campaigns": 0, "active_agents": 0}
         
         try:
-            # Get counts from each table
-            jobs_result = self.supabase.table("progressive_agent_jobs").select("id", count="exact").execute()
-            contacts_result = self.supabase.table("progressive_agent_contacts").select("id", count="exact").execute()
-            campaigns_result = self.supabase.table("progressive_agent_campaigns").select("id", count="exact").execute()
-            agents_result = self.supabase.table("progressive_agents").select("id", count="exact").neq("status", "completed").execute()
+            try:
+                # Single-row materialized view refreshed by pg_cron
+                result = await supabase.table("progressive_dashboard_counts").select(
+                    "total_jobs,total_contacts,total_campaigns,active_agents"
+                ).single().execute()
+                stats = result.data
+            except Exception as view_error:
+                logger.warning(f"⚠️ Dashboard counts view unavailable, counting tables directly: {view_error}")
+                stats = await self._count_dashboard_stats(supabase)
             
-            return {
-                "total_jobs": jobs_result.count or 0,
-                "total_contacts": contacts_result.count or 0,
-                "total_campaigns": campaigns_result.count or 0,
-                "active_agents": agents_result.count or 0
-            }
+            _dashboard_cache["stats"] = stats
+            _dashboard_cache["expires_at"] = now + DASHBOARD_CACHE_TTL
+            return stats
             
         except Exception as e:
             logger.error(f"❌ Error getting dashboard stats: {e}")
             return {"total_jobs": 0, "total_contacts": 0, "total_campaigns": 0, "active_agents": 0}
+    
+    async def _count_dashboard_stats(self, supabase: AsyncClient) -> Dict[str, Any]:
+        """Count dashboard statistics from the underlying tables"""
+        # Get counts from each table concurrently; a failed count reports 0
+        results = await asyncio.gather(
+            supabase.table("progressive_agent_jobs").select("id", count="exact").execute(),
+            supabase.table("progressive_agent_contacts").select("id", count="exact").execute(),
+            supabase.table("progressive_agent_campaigns").select("id", count="exact").execute(),
+            supabase.table("progressive_agents").select("id", count="exact").neq("status", "completed").execute(),
+            return_exceptions=True
+        )
+        
+        stats = {}
+        for name, result in zip(("total_jobs", "total_contacts", "total_campaigns", "active_agents"), results):
+            if isinstance(result, Exception):
+                logger.error(f"❌ Error counting {name}: {result}")
+                stats[name] = 0
+            else:
+                stats[name] = result.count or 0
+        return stats
 
 # Global instance
 progressive_agent_db = ProgressiveAgentDB()
@@ -4,48 +4,76 @@ Progressive Agent Manager - Handles staged agent creation with real-time updates
 import asyncio
 import json
 import logging
+from collections import namedtuple
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set
+from cachetools import TTLCache
 from api.models import ProgressiveAgent, AgentStage, StagedResults, ProgressiveAgentResponse
 from .progressive_agent_db import progressive_agent_db
 
 logger = logging.getLogger(__name__)
 
+# ProgressiveAgent fields that map onto progressive_agents columns
+AGENT_METADATA_FIELDS = frozenset({
+    "query", "status", "total_progress", "hours_old", "custom_tags",
+    "target_type", "company_size", "location_filter"
+})
+
+StageDef = namedtuple("StageDef", "key name timeout weight")
+
+def _now_iso() -> str:
+    """Current local time as an ISO string; call once per update and reuse it"""
+    return datetime.now().isoformat()
+
 class ProgressiveAgentManager:
+    # Finished agents stay in memory briefly for polling; the DB keeps long-term state
+    FINISHED_AGENT_GRACE_SECONDS = 300
+    
     def __init__(self):
-        self.active_agents: Dict[str, ProgressiveAgent] = {}
-        self.stage_definitions = {
-            "linkedin_fetch": {
-                "name": "LinkedIn Job Fetching",
-                "timeout": 180,  # 3 minutes max
-                "weight": 40  # 40% of total progress
-            },
-            "other_boards": {
-                "name": "Other Job Boards",
-                "timeout": 300,  # 5 minutes max
-                "weight": 30  # 30% of total progress
-            },
-            "contact_enrichment": {
-                "name": "Contact Discovery & Verification",
-                "timeout": 600,  # 10 minutes max
-                "weight": 20  # 20% of total progress
-            },
-            "campaign_creation": {
-                "name": "Campaign Creation",
-                "timeout": 120,  # 2 minutes max
-                "weight": 10  # 10% of total progress
-            }
+        # Bounded so long-running processes don't accumulate every agent ever created
+        self.active_agents: TTLCache = TTLCache(maxsize=2048, ttl=3600)
+        # Latest unsaved metadata per agent, flushed once updates pause for meta_flush_delay
+        self._pending_meta: Dict[str, Dict[str, Any]] = {}
+        self._meta_flush_handles: Dict[str, asyncio.TimerHandle] = {}
+        self._meta_first_pending: Dict[str, float] = {}
+        self.meta_flush_delay = 0.5  # seconds
+        self.meta_flush_max_wait = 2.0  # seconds; steady updates still flush this often
+        # Last metadata write per agent, so the next one waits for it and can't land out of order
+        self._meta_writes: Dict[str, asyncio.Task] = {}
+        # Stage results waiting to be written, drained in batches by one worker
+        self._outbox: asyncio.Queue = asyncio.Queue(maxsize=50_000)
+        self._outbox_task: Optional[asyncio.Task] = None
+        # Strong references to in-flight background writes so they aren't garbage collected
+        self._bg_tasks: Set[asyncio.Task] = set()
+        # Fixed stage schema, walked in order on every progress update
+        self._stage_defs = (
+            StageDef("linkedin_fetch", "LinkedIn Job Fetching", timeout=180, weight=40),  # 3 minutes max, 40% of progress
+            StageDef("other_boards", "Other Job Boards", timeout=300, weight=30),  # 5 minutes max, 30% of progress
+            StageDef("contact_enrichment", "Contact Discovery & Verification", timeout=600, weight=20),  # 10 minutes max, 20% of progress
+            StageDef("campaign_creation", "Campaign Creation", timeout=120, weight=10)  # 2 minutes max, 10% of progress
+        )
+        # Only the LinkedIn stage is truly critical
+        self._critical_stages = frozenset({"linkedin_fetch"})
+    
+    @property
+    def stage_definitions(self) -> Dict[str, Dict[str, Any]]:
+        """Stage definitions keyed by stage, in the original dict layout"""
+        return {
+            stage_def.key: {"name": stage_def.name, "timeout": stage_def.timeout, "weight": stage_def.weight}
+            for stage_def in self._stage_defs
         }
     
     def create_progressive_agent(self, query: str, hours_old: int = 24, custom_tags: Optional[List[str]] = None, target_type: str = "hiring_managers", company_size: str = "all", location_filter: Optional[str] = None) -> ProgressiveAgent:
         """Create a new progressive agent with initial stages"""
-        agent_id = f"agent_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+        now = datetime.now()
+        ts = now.isoformat()
+        agent_id = f"agent_{now:%Y%m%d_%H%M%S_%f}"
         
         # Initialize stages
         stages = {}
-        for stage_key, stage_config in self.stage_definitions.items():
-            stages[stage_key] = AgentStage(
-                name=stage_config["name"],
+        for stage_def in self._stage_defs:
+            stages[stage_def.key] = AgentStage(
+                name=stage_def.name,
                 status="pending",
                 progress=0
             )
@@ -54,8 +82,8 @@ class ProgressiveAgentManager:
             id=agent_id,
             query=query,
             status="initializing",
-            created_at=datetime.now().isoformat(),
-            updated_at=datetime.now().isoformat(),
+            created_at=ts,
+            updated_at=ts,
             total_progress=0,
             stages=stages,
             staged_results=StagedResults(),
@@ -69,32 +97,25 @@ class ProgressiveAgentManager:
         self.active_agents[agent_id] = agent
         
         # Save to database
-        asyncio.create_task(progressive_agent_db.save_agent_metadata(
-            agent_id=agent_id,
-            query=query,
-            status="initializing",
-            hours_old=hours_old,
-            custom_tags=custom_tags or [],
-            total_progress=0,
-            target_type=target_type,
-            company_size=company_size,
-            location_filter=location_filter
-        ))
+        metadata = agent.model_dump(include=AGENT_METADATA_FIELDS)
+        metadata["custom_tags"] = metadata["custom_tags"] or []
+        self._schedule_meta(agent_id, **metadata)
         
-        logger.info(f"🚀 Created progressive agent: {agent_id} (target: {target_type}, size: {company_size})")
+        logger.info("🚀 Created progressive agent: %s (target: %s, size: %s)", agent_id, target_type, company_size)
         return agent
     
     def update_stage_status(self, agent_id: str, stage_key: str, status: str, progress: int = 0, results_count: int = 0, error_message: Optional[str] = None):
         """Update the status of a specific stage"""
         if agent_id not in self.active_agents:
-            logger.warning(f"Agent {agent_id} not found for stage update")
+            logger.warning("Agent %s not found for stage update", agent_id)
             return
         
         agent = self.active_agents[agent_id]
         if stage_key not in agent.stages:
-            logger.warning(f"Stage {stage_key} not found for agent {agent_id}")
+            logger.warning("Stage %s not found for agent %s", stage_key, agent_id)
             return
         
+        ts = _now_iso()
         stage = agent.stages[stage_key]
         stage.status = status
         stage.progress = progress
@@ -102,115 +123,147 @@ class ProgressiveAgentManager:
         stage.error_message = error_message
         
         if status == "running" and stage.started_at is None:
-            stage.started_at = datetime.now().isoformat()
+            stage.started_at = ts
         elif status in ["completed", "failed"]:
-            stage.completed_at = datetime.now().isoformat()
+            stage.completed_at = ts
         
         # Update overall progress
         self._calculate_total_progress(agent_id)
-        agent.updated_at = datetime.now().isoformat()
+        agent.updated_at = ts
         
-        logger.info(f"📊 Agent {agent_id} - Stage {stage_key}: {status} ({progress}%)")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("📊 Agent %s - Stage %s: %s (%s%%)", agent_id, stage_key, status, progress)
     
-    def add_stage_results(self, agent_id: str, stage_key: str, results: List[Dict], result_type: str):
+    async def add_stage_results(self, agent_id: str, stage_key: str, results: List[Dict], result_type: str):
         """Add results from a specific stage"""
         if agent_id not in self.active_agents:
             return
         
         agent = self.active_agents[agent_id]
+        staged = agent.staged_results
         
+        # Keep running totals so each append is O(1) instead of re-measuring every list
         if result_type == "linkedin_jobs":
-            agent.staged_results.linkedin_jobs.extend(results)
-            # Save jobs to database
-            asyncio.create_task(self._save_jobs_safely(agent_id, results))
+            staged.linkedin_jobs.extend(results)
+            staged.total_jobs += len(results)
         elif result_type == "other_jobs":
-            agent.staged_results.other_jobs.extend(results)
-            # Save jobs to database
-            asyncio.create_task(self._save_jobs_safely(agent_id, results))
+            staged.other_jobs.extend(results)
+            staged.total_jobs += len(results)
         elif result_type == "contacts":
-            agent.staged_results.verified_contacts.extend(results)
-            # Save contacts to database
-            asyncio.create_task(self._save_contacts_safely(agent_id, results))
+            staged.verified_contacts.extend(results)
+            staged.total_contacts += len(results)
         elif result_type == "campaigns":
-            agent.staged_results.campaigns.extend(results)
-            # Save campaigns to database
-            asyncio.create_task(self._save_campaigns_safely(agent_id, results))
+            staged.campaigns.extend(results)
+            staged.total_campaigns += len(results)
         
-        # Update totals
-        agent.staged_results.total_jobs = len(agent.staged_results.linkedin_jobs) + len(agent.staged_results.other_jobs)
-        agent.staged_results.total_contacts = len(agent.staged_results.verified_contacts)
-        agent.staged_results.total_campaigns = len(agent.staged_results.campaigns)
+        # Save results to database
+        self.start_outbox_worker()
+        # Waits when the outbox is full so producers slow down instead of piling up writes
+        await self._outbox.put((result_type, agent_id, results))
         
         # Update stage results count
         if stage_key in agent.stages:
             agent.stages[stage_key].results_count = len(results)
         
-        agent.updated_at = datetime.now().isoformat()
+        agent.updated_at = _now_iso()
         
         # Update agent metadata in database
-        asyncio.create_task(progressive_agent_db.save_agent_metadata(
-            agent_id=agent_id,
+        self._schedule_meta(
+            agent_id,
             query=agent.query,
             status=agent.status,
             total_progress=agent.total_progress,
-            total_jobs=agent.staged_results.total_jobs,
-            total_contacts=agent.staged_results.total_contacts,
-            total_campaigns=agent.staged_results.total_campaigns
-        ))
+            total_jobs=staged.total_jobs,
+            total_contacts=staged.total_contacts,
+            total_campaigns=staged.total_campaigns
+        )
         
-        logger.info(f"➕ Agent {agent_id} - Added {len(results)} {result_type} from {stage_key}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("➕ Agent %s - Added %s %s from %s", agent_id, len(results), result_type, stage_key)
     
     def _calculate_total_progress(self, agent_id: str):
         """Calculate total progress based on stage weights"""
         agent = self.active_agents[agent_id]
-        total_progress = 0
+        stages = agent.stages
         
-        for stage_key, stage in agent.stages.items():
-            if stage_key in self.stage_definitions:
-                weight = self.stage_definitions[stage_key]["weight"]
-                stage_progress = stage.progress / 100
-                total_progress += weight * stage_progress
+        # Single pass: weighted progress, result totals, running state and critical stage outcome
+        weighted_progress = 0
+        total_jobs = 0
+        has_running = False
+        critical_failed = True
+        linkedin_done = False
+        critical_stages = self._critical_stages
+        for stage_key, _, _, weight in self._stage_defs:
+            stage = stages.get(stage_key)
+            if stage is None:
+                continue
+            status = stage.status
+            weighted_progress += weight * stage.progress
+            total_jobs += stage.results_count or 0
+            if status == "running":
+                has_running = True
+            if stage_key in critical_stages and status != "failed":
+                critical_failed = False
+            if stage_key == "linkedin_fetch":
+                linkedin_done = status in ("completed", "failed")
         
-        agent.total_progress = int(total_progress)
+        agent.total_progress = weighted_progress // 100
         
         # Update overall status with improved logic
         if agent.total_progress == 100:
             agent.status = "completed"
-        else:
-            # Check if critical stages failed
-            critical_stages = ["linkedin_fetch"]  # Only LinkedIn stage is truly critical
-            critical_failed = all(
-                agent.stages[stage].status == "failed" 
-                for stage in critical_stages 
-                if stage in agent.stages
-            )
-            
-            # Check if we have enough data to consider it successful
-            total_jobs = sum(stage.results_count for stage in agent.stages.values() if stage.results_count)
-            
-            if critical_failed and total_jobs == 0:
-                # Only mark as failed if critical stages failed AND we have no results
-                agent.status = "failed"
-            elif total_jobs > 0:
-                # We have some results, consider it successful even if some stages are incomplete
-                if agent.total_progress >= 80:  # If we're 80% done and have results, call it completed
-                    agent.status = "completed"
-                    agent.total_progress = 100
-                else:
-                    agent.status = "enrichment_stage"
-            elif any(stage.status == "running" for stage in agent.stages.values()):
-                if agent.stages["linkedin_fetch"].status in ["completed", "failed"]:
-                    agent.status = "enrichment_stage"
-                else:
-                    agent.status = "linkedin_stage"
+        elif critical_failed and total_jobs == 0:
+            # Only mark as failed if critical stages failed AND we have no results
+            agent.status = "failed"
+        elif total_jobs > 0:
+            # We have some results, consider it successful even if some stages are incomplete
+            if agent.total_progress >= 80:  # If we're 80% done and have results, call it completed
+                agent.status = "completed"
+                agent.total_progress = 100
             else:
-                # Default to enrichment stage if stages are done but not failed
                 agent.status = "enrichment_stage"
+        elif has_running:
+            agent.status = "enrichment_stage" if linkedin_done else "linkedin_stage"
+        else:
+            # Default to enrichment stage if stages are done but not failed
+            agent.status = "enrichment_stage"
     
     def get_agent(self, agent_id: str) -> Optional[ProgressiveAgent]:
         """Get an agent by ID"""
         return self.active_agents.get(agent_id)
     
+    async def load_agent(self, agent_id: str) -> Optional[ProgressiveAgent]:
+        """Get an agent by ID, hydrating it from the database if it has been evicted"""
+        agent = self.active_agents.get(agent_id)
+        if agent is not None:
+            return agent
+        
+        row = await progressive_agent_db.get_agent(agent_id)
+        if not row:
+            return None
+        
+        # Only metadata and totals are persisted; result rows are served by the /leads endpoints
+        agent = ProgressiveAgent(
+            id=agent_id,
+            query=row.get("query") or "",
+            status=row.get("status") or "completed",
+            created_at=row.get("created_at") or "",
+            updated_at=row.get("updated_at") or "",
+            total_progress=row.get("total_progress") or 0,
+            staged_results=StagedResults(
+                total_jobs=row.get("total_jobs") or 0,
+                total_contacts=row.get("total_contacts") or 0,
+                total_campaigns=row.get("total_campaigns") or 0
+            ),
+            hours_old=row.get("hours_old") or 24,
+            custom_tags=row.get("custom_tags"),
+            target_type=row.get("target_type") or "hiring_managers",
+            company_size=row.get("company_size") or "all",
+            location_filter=row.get("location_filter")
+        )
+        self.active_agents[agent_id] = agent
+        return agent
+    
     def get_all_agents(self) -> List[ProgressiveAgent]:
         """Get all active agents"""
         return list(self.active_agents.values())
@@ -219,25 +272,28 @@ class ProgressiveAgentManager:
         """Mark an agent as failed with error message"""
         if agent_id in self.active_agents:
             agent = self.active_agents[agent_id]
+            ts = _now_iso()
             agent.status = "failed"
-            agent.updated_at = datetime.now().isoformat()
+            agent.updated_at = ts
             
             # Mark any running stages as failed
             for stage in agent.stages.values():
                 if stage.status == "running":
                     stage.status = "failed"
                     stage.error_message = error_message
-                    stage.completed_at = datetime.now().isoformat()
+                    stage.completed_at = ts
             
             # Update in database
-            asyncio.create_task(progressive_agent_db.save_agent_metadata(
-                agent_id=agent_id,
+            self._schedule_meta(
+                agent_id,
                 query=agent.query,
                 status="failed",
                 total_progress=agent.total_progress
-            ))
+            )
+            
+            self._schedule_eviction(agent_id)
             
-            logger.error(f"❌ Agent {agent_id} marked as failed: {error_message}")
+            logger.error("❌ Agent %s marked as failed: %s", agent_id, error_message)
     
     def finalize_agent(self, agent_id: str, final_stats: Dict):
         """Finalize an agent with final statistics"""
@@ -246,22 +302,24 @@ class ProgressiveAgentManager:
             agent.final_stats = final_stats
             agent.status = "completed"
             agent.total_progress = 100
-            agent.updated_at = datetime.now().isoformat()
+            ts = _now_iso()
+            agent.updated_at = ts
             
             # Update in database
-            asyncio.create_task(progressive_agent_db.save_agent_metadata(
-                agent_id=agent_id,
+            self._schedule_meta(
+                agent_id,
                 query=agent.query,
                 status="completed",
                 total_progress=100,
                 total_jobs=agent.staged_results.total_jobs,
                 total_contacts=agent.staged_results.total_contacts,
                 total_campaigns=agent.staged_results.total_campaigns,
-                completed_at=datetime.now().isoformat()
-            ))
+                completed_at=ts
+            )
+            self._schedule_eviction(agent_id)
             
             # Also save to memory manager for dashboard stats
-            from utils.memory_manager import get_memory_manager
+            from api.dependencies import get_memory_manager
             memory_manager = get_memory_manager()
             
             agent_data = {
@@ -271,47 +329,168 @@ class ProgressiveAgentManager:
                 "start_time": agent.created_at,
                 "end_time": agent.updated_at,
                 "total_jobs_found": agent.staged_results.total_jobs,
-                "total_jobs": agent.staged_results.total_jobs,  # Also set this for compatibility
                 "total_emails_found": agent.staged_results.total_contacts,
-                "total_contacts": agent.staged_results.total_contacts,
                 "total_campaigns": agent.staged_results.total_campaigns,
-                "jobs_found": agent.staged_results.total_jobs,  # Alternative field name
                 "final_stats": final_stats,
-                "hours_old": getattr(agent, 'hours_old', 24),
-                "custom_tags": getattr(agent, 'custom_tags', None),
-                "target_type": getattr(agent, 'target_type', 'hiring_managers'),
-                "company_size": getattr(agent, 'company_size', 'all'),
-                "location_filter": getattr(agent, 'location_filter', None)
+                "hours_old": agent.hours_old,
+                "custom_tags": agent.custom_tags,
+                "target_type": agent.target_type,
+                "company_size": agent.company_size,
+                "location_filter": agent.location_filter
             }
             
             memory_manager.save_agent_data(agent_id, agent_data)
             
-            logger.info(f"✅ Agent {agent_id} finalized with stats: {final_stats}")
-            logger.info(f"💾 Agent {agent_id} saved to memory manager with {agent.staged_results.total_jobs} jobs")
+            logger.info("✅ Agent %s finalized with stats: %s", agent_id, final_stats)
+            logger.info("💾 Agent %s saved to memory manager with %s jobs", agent_id, agent.staged_results.total_jobs)
+    
+    def _release_payloads(self, agent: ProgressiveAgent):
+        """Drop an evicted agent's result lists; they are persisted and the totals are kept"""
+        staged = agent.staged_results
+        staged.linkedin_jobs = []
+        staged.other_jobs = []
+        staged.verified_contacts = []
+        staged.campaigns = []
+    
+    def _schedule_eviction(self, agent_id: str):
+        """Drop a finished agent from memory after a short grace period"""
+        loop = asyncio.get_running_loop()
+        loop.call_later(self.FINISHED_AGENT_GRACE_SECONDS, self._evict, agent_id)
+    
+    def _evict(self, agent_id: str):
+        """Remove a finished agent from memory and release its result lists"""
+        agent = self.active_agents.pop(agent_id, None)
+        if agent is not None:
+            self._release_payloads(agent)
+    
+    def _schedule_meta(self, agent_id: str, **payload):
+        """Queue an agent metadata write, debouncing bursts into one upsert"""
+        # Merge so fields from earlier calls in the same window are not lost
+        self._pending_meta.setdefault(agent_id, {}).update(payload)
+        
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        first = self._meta_first_pending.setdefault(agent_id, now)
+        handle = self._meta_flush_handles.get(agent_id)
+        if handle is not None:
+            handle.cancel()
+        delay = max(0.0, min(self.meta_flush_delay, first + self.meta_flush_max_wait - now))
+        self._meta_flush_handles[agent_id] = loop.call_later(delay, self._flush_meta, agent_id)
+    
+    def _flush_meta(self, agent_id: str):
+        """Start an agent's metadata write, chained after its previous one"""
+        self._meta_flush_handles.pop(agent_id, None)
+        self._meta_first_pending.pop(agent_id, None)
+        if agent_id not in self._pending_meta:
+            return
+        
+        task = self._spawn(self._write_meta(agent_id, self._meta_writes.get(agent_id)))
+        self._meta_writes[agent_id] = task
+        task.add_done_callback(lambda t: self._meta_writes.pop(agent_id, None) if self._meta_writes.get(agent_id) is t else None)
+    
+    async def _write_meta(self, agent_id: str, previous: Optional[asyncio.Task]):
+        """Write the latest pending metadata for an agent once its previous write is done"""
+        if previous is not None:
+            await asyncio.wait({previous})
+        # Read at write time so the newest merged snapshot is what gets saved
+        payload = self._pending_meta.pop(agent_id, None)
+        if payload:
+            await progressive_agent_db.save_agent_metadata(agent_id=agent_id, **payload)
+    
+    def _spawn(self, coro) -> asyncio.Task:
+        """Run a background write, keeping a reference until it finishes"""
+        task = asyncio.create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._on_bg_task_done)
+        return task
+    
+    def _on_bg_task_done(self, task: asyncio.Task):
+        """Forget a finished background write and log it if it failed"""
+        self._bg_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("❌ Background write failed: %s", task.exception())
+    
+    def start_outbox_worker(self):
+        """Start the background worker that writes queued stage results, if it isn't running"""
+        if self._outbox_task is None or self._outbox_task.done():
+            self._outbox_task = asyncio.create_task(self._outbox_worker())
+    
+    async def drain_outbox(self):
+        """Wait until every queued stage result and pending metadata write has been handed to the database"""
+        await self._outbox.join()
+        
+        # Flush metadata still waiting for its coalescing window
+        for agent_id, handle in list(self._meta_flush_handles.items()):
+            handle.cancel()
+            self._flush_meta(agent_id)
+        
+        if self._bg_tasks:
+            await asyncio.gather(*self._bg_tasks, return_exceptions=True)
+    
+    async def _outbox_worker(self):
+        """Drain up to 5000 queued results or 500ms worth, then write one batch per agent and kind"""
+        loop = asyncio.get_running_loop()
+        while True:
+            events = [await self._outbox.get()]
+            deadline = loop.time() + 0.5
+            
+            while len(events) < 5000:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    events.append(await asyncio.wait_for(self._outbox.get(), timeout=timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            # Coalesce results for the same agent and kind into one save
+            groups: Dict[tuple, List[Dict[str, Any]]] = {}
+            for result_type, agent_id, results in events:
+                kind = "jobs" if result_type in ("linkedin_jobs", "other_jobs") else result_type
+                groups.setdefault((kind, agent_id), []).extend(results)
+            
+            try:
+                await asyncio.gather(*(
+                    self._dispatch_write(kind, agent_id, results)
+                    for (kind, agent_id), results in groups.items()
+                ))
+            finally:
+                for _ in events:
+                    self._outbox.task_done()
+    
+    async def _dispatch_write(self, result_type: str, agent_id: str, results: List[Dict[str, Any]]):
+        """Route stage results to the matching database save"""
+        # Saves only queue rows; the batch writer does one write at a time per table
+        if result_type in ("jobs", "linkedin_jobs", "other_jobs"):
+            await self._save_jobs_safely(agent_id, results)
+        elif result_type == "contacts":
+            await self._save_contacts_safely(agent_id, results)
+        elif result_type == "campaigns":
+            await self._save_campaigns_safely(agent_id, results)
     
     async def _save_jobs_safely(self, agent_id: str, jobs: List[Dict[str, Any]]):
         """Safely save jobs to database with error handling"""
         try:
             await progressive_agent_db.save_jobs(agent_id, jobs)
-            logger.info(f"💼 Saved {len(jobs)} jobs for agent {agent_id}")
+            logger.info("💼 Queued %s jobs for agent %s", len(jobs), agent_id)
         except Exception as e:
-            logger.error(f"❌ Failed to save jobs for agent {agent_id}: {e}")
+            logger.error("❌ Failed to save jobs for agent %s: %s", agent_id, e)
     
     async def _save_contacts_safely(self, agent_id: str, contacts: List[Dict[str, Any]]):
         """Safely save contacts to database with error handling"""
         try:
             await progressive_agent_db.save_contacts(agent_id, contacts)
-            logger.info(f"👥 Saved {len(contacts)} contacts for agent {agent_id}")
+            logger.info("👥 Queued %s contacts for agent %s", len(contacts), agent_id)
         except Exception as e:
-            logger.error(f"❌ Failed to save contacts for agent {agent_id}: {e}")
+            logger.error("❌ Failed to save contacts for agent %s: %s", agent_id, e)
     
     async def _save_campaigns_safely(self, agent_id: str, campaigns: List[Dict[str, Any]]):
         """Safely save campaigns to database with error handling"""
         try:
             await progressive_agent_db.save_campaigns(agent_id, campaigns)
-            logger.info(f"📧 Saved {len(campaigns)} campaigns for agent {agent_id}")
+            logger.info("📧 Queued %s campaigns for agent %s", len(campaigns), agent_id)
         except Exception as e:
-            logger.error(f"❌ Failed to save campaigns for agent {agent_id}: {e}")
+            logger.error("❌ Failed to save campaigns for agent %s: %s", agent_id, e)
 
 # Global instance
 progressive_agent_manager = ProgressiveAgentManager()
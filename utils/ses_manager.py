@@ -2,28 +2,206 @@
 Amazon SES Email Manager for COOGI
 Handles email sending, bounce/complaint tracking, and delivery optimization
 """
+import asyncio
 import boto3
+import hashlib
 import json
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set
+from botocore.config import Config
+from cachetools import TTLCache
 from botocore.exceptions import ClientError
 from datetime import datetime
 import os
 
+# Use faster JSON encoder if available
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Bloom filter keeps a large suppression list in a few MB; falls back to an exact set
+try:
+    from pybloom_live import ScalableBloomFilter
+except ImportError:
+    ScalableBloomFilter = None
+
 logger = logging.getLogger(__name__)
 
+# Sized for concurrent sends; botocore's default pool is only 10 connections
+SES_CONFIG = Config(
+    max_pool_connections=int(os.getenv('SES_POOL', '64')),
+    retries={'max_attempts': 3, 'mode': 'adaptive'},
+    tcp_keepalive=True
+)
+_CS_UTF8 = 'UTF-8'
+SES_BULK_MAX_DESTINATIONS = 50  # SES hard limit per SendBulkTemplatedEmail call
+SES_BULK_CONCURRENCY = int(os.getenv('SES_BULK_CONC', '8'))
+
+_ses_client = None
+
+# Templates this process has created or updated, by name -> content digest
+_known_templates: Dict[str, str] = {}
+
+# Account stats change slowly and SES throttles these calls; absorb dashboard polling
+_stats_cache: TTLCache = TTLCache(maxsize=4, ttl=30)
+
+# Process-wide suppression list; new entries are written to the database in batches
+SUPPRESSION_TABLE = "email_suppression"
+SUPPRESSION_BATCH_SIZE = 500
+SUPPRESSION_FLUSH_DELAY = 1.0  # seconds
+SUPPRESSION_PAGE_SIZE = 1000  # rows per page when loading the list at startup
+# Every suppressed address, possibly with false positives when backed by a Bloom filter
+_suppressed = (
+    ScalableBloomFilter(initial_capacity=1_000_000, error_rate=0.001)
+    if ScalableBloomFilter is not None else set()
+)
+# Addresses suppressed by this process, known exactly even before they reach the database
+_recently_suppressed: Set[str] = set()
+_pending_suppress: List[Dict[str, str]] = []
+_suppress_flush_handle: Optional[asyncio.TimerHandle] = None
+# Strong references to running flushes so they aren't garbage collected mid-write
+_suppress_flush_tasks: Set[asyncio.Task] = set()
+# One flush at a time, so rows are only removed from the pending list by the flush that saved them
+_suppress_flush_lock = asyncio.Lock()
+
+def _suppress(email: str, reason: str, detail: str):
+    """Add an address to the suppression list and queue it for the database"""
+    email = email.lower()
+    if email in _recently_suppressed:
+        return
+    _suppressed.add(email)
+    _recently_suppressed.add(email)
+    _pending_suppress.append({"email": email, "reason": reason, "detail": detail})
+
+async def load_suppression_list():
+    """Load stored suppressions into memory so sends can be filtered without a query"""
+    from .progressive_agent_db import get_client
+    supabase = await get_client()
+    if not supabase:
+        return
+    
+    loaded = 0
+    try:
+        while True:
+            result = await supabase.table(SUPPRESSION_TABLE).select("email").order("email").range(
+                loaded, loaded + SUPPRESSION_PAGE_SIZE - 1
+            ).execute()
+            rows = result.data or []
+            for row in rows:
+                _suppressed.add(row["email"].lower())
+            loaded += len(rows)
+            if len(rows) < SUPPRESSION_PAGE_SIZE:
+                break
+        logger.info(f"🚫 Loaded {loaded} suppressed addresses")
+    except Exception as e:
+        logger.error(f"❌ Failed to load suppression list after {loaded} rows: {e}")
+
+async def filter_suppressed(emails: List[str]) -> List[str]:
+    """Drop suppressed addresses; Bloom filter hits are confirmed against the database"""
+    candidates = {email.lower() for email in emails if email.lower() in _suppressed}
+    if not candidates:
+        return emails
+    
+    suppressed = await _confirm_suppressed(candidates)
+    return [email for email in emails if email.lower() not in suppressed]
+
+async def _confirm_suppressed(candidates: Set[str]) -> Set[str]:
+    """Return the candidates that are really suppressed"""
+    if isinstance(_suppressed, set):
+        return candidates
+    
+    confirmed = candidates & _recently_suppressed
+    unknown = candidates - confirmed
+    if not unknown:
+        return confirmed
+    
+    from .progressive_agent_db import get_client
+    supabase = await get_client()
+    if not supabase:
+        return candidates
+    
+    try:
+        result = await supabase.table(SUPPRESSION_TABLE).select("email").in_("email", list(unknown)).execute()
+        confirmed.update(row["email"] for row in result.data or [])
+        return confirmed
+    except Exception as e:
+        # Err on the side of not sending when the authoritative check fails
+        logger.error(f"❌ Failed to confirm suppressed addresses: {e}")
+        return candidates
+
+def _schedule_suppression_flush():
+    """Flush pending suppressions now if the batch is full, otherwise after a short delay"""
+    global _suppress_flush_handle
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    
+    if len(_pending_suppress) >= SUPPRESSION_BATCH_SIZE:
+        if _suppress_flush_handle is not None:
+            _suppress_flush_handle.cancel()
+            _suppress_flush_handle = None
+        _spawn_suppression_flush()
+    elif _pending_suppress and _suppress_flush_handle is None:
+        _suppress_flush_handle = loop.call_later(SUPPRESSION_FLUSH_DELAY, _spawn_suppression_flush)
+
+def _spawn_suppression_flush():
+    """Start a suppression flush, keeping a reference until it finishes"""
+    task = asyncio.get_running_loop().create_task(_flush_suppressions())
+    _suppress_flush_tasks.add(task)
+    task.add_done_callback(_suppress_flush_tasks.discard)
+
+async def _flush_suppressions():
+    """Write all pending suppressions in one upsert, keeping them queued if it fails"""
+    global _suppress_flush_handle
+    _suppress_flush_handle = None
+    
+    async with _suppress_flush_lock:
+        if not _pending_suppress:
+            return
+        
+        rows = _pending_suppress[:]
+        
+        from .progressive_agent_db import get_client
+        supabase = await get_client()
+        if not supabase:
+            logger.warning(f"⚠️ Supabase unavailable - keeping {len(rows)} suppressed addresses queued")
+            return
+        
+        try:
+            await supabase.table(SUPPRESSION_TABLE).upsert(
+                rows, on_conflict="email", ignore_duplicates=True, returning="minimal"
+            ).execute()
+            # Suppressions added during the upsert stay queued for the next flush
+            del _pending_suppress[:len(rows)]
+            logger.info(f"🚫 Saved {len(rows)} suppressed addresses")
+        except Exception as e:
+            logger.error(f"❌ Failed to save {len(rows)} suppressed addresses, keeping them queued: {e}")
+
+def _dumps(data: Any) -> str:
+    """Serialize template data to the JSON string SES expects"""
+    return orjson.dumps(data).decode() if orjson else json.dumps(data)
+
+def get_ses_client():
+    """Get the shared SES client so every caller reuses one keep-alive connection pool"""
+    global _ses_client
+    if _ses_client is None:
+        session = boto3.Session(
+            aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
+            aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
+            region_name=os.getenv('AWS_REGION', 'us-east-1')
+        )
+        _ses_client = session.client('ses', config=SES_CONFIG)
+    return _ses_client
+
 class SESManager:
     """Amazon SES email delivery manager"""
     
     def __init__(self):
         """Initialize SES client"""
         try:
-            self.ses_client = boto3.client(
-                'ses',
-                aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-                aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
-                region_name=os.getenv('AWS_REGION', 'us-east-1')
-            )
+            self.ses_client = get_ses_client()
             logger.info("✅ SES Manager initialized successfully")
         except Exception as e:
             logger.error(f"❌ Failed to initialize SES client: {e}")
@@ -42,7 +220,7 @@ class SESManager:
             logger.error(f"❌ Failed to verify email {email}: {e}")
             return False
     
-    def send_email(
+    async def send_email(
         self,
         to_emails: List[str],
         subject: str,
@@ -51,33 +229,33 @@ class SESManager:
         from_email: str,
         reply_to: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Send email via SES"""
+        """Send email via SES without blocking the event loop"""
         try:
             if not self.ses_client:
                 return {"success": False, "error": "SES client not initialized"}
             
-            destination = {
-                'ToAddresses': to_emails
-            }
+            to_emails = await filter_suppressed(to_emails)
+            if not to_emails:
+                return {"success": False, "error": "All recipients are suppressed", "timestamp": datetime.now().isoformat()}
             
-            message = {
-                'Subject': {'Data': subject, 'Charset': 'UTF-8'},
-                'Body': {
-                    'Html': {'Data': body_html, 'Charset': 'UTF-8'},
-                    'Text': {'Data': body_text, 'Charset': 'UTF-8'}
-                }
-            }
+            # Only send the body parts that have content; SES needs at least one
+            body = {}
+            if body_html:
+                body['Html'] = {'Data': body_html, 'Charset': _CS_UTF8}
+            if body_text or not body_html:
+                body['Text'] = {'Data': body_text, 'Charset': _CS_UTF8}
             
             kwargs = {
                 'Source': from_email,
-                'Destination': destination,
-                'Message': message
+                'Destination': {'ToAddresses': to_emails},
+                'Message': {'Subject': {'Data': subject, 'Charset': _CS_UTF8}, 'Body': body}
             }
             
             if reply_to:
                 kwargs['ReplyToAddresses'] = [reply_to]
             
-            response = self.ses_client.send_email(**kwargs)
+            # boto3 clients are thread-safe; the shared pool serves concurrent sends
+            response = await asyncio.to_thread(self.ses_client.send_email, **kwargs)
             
             return {
                 "success": True,
@@ -96,45 +274,81 @@ class SESManager:
                 "timestamp": datetime.now().isoformat()
             }
     
-    def send_bulk_emails(
+    async def send_bulk_emails(
         self,
         emails_data: List[Dict[str, Any]],
         template_name: str,
         from_email: str
     ) -> Dict[str, Any]:
-        """Send bulk personalized emails using SES templates"""
-        try:
-            if not self.ses_client:
-                return {"success": False, "error": "SES client not initialized"}
-            
-            destinations = []
-            for email_data in emails_data:
-                destination = {
-                    'Destination': {
-                        'ToAddresses': [email_data['email']]
-                    },
-                    'ReplacementTemplateData': json.dumps(email_data.get('template_data', {}))
-                }
-                destinations.append(destination)
-            
-            response = self.ses_client.send_bulk_templated_email(
-                Source=from_email,
-                Template=template_name,
-                DefaultTemplateData='{}',
-                Destinations=destinations
-            )
-            
-            return {
-                "success": True,
-                "message_ids": [status['MessageId'] for status in response['Status']],
-                "sent_count": len([s for s in response['Status'] if s['Status'] == 'Success']),
-                "failed_count": len([s for s in response['Status'] if s['Status'] != 'Success']),
-                "timestamp": datetime.now().isoformat()
+        """Send bulk personalized emails using SES templates, in concurrent 50-destination chunks"""
+        if not self.ses_client:
+            return {"success": False, "error": "SES client not initialized"}
+        
+        allowed = set(await filter_suppressed([email_data['email'] for email_data in emails_data]))
+        destinations = [
+            {
+                'Destination': {
+                    'ToAddresses': [email_data['email']]
+                },
+                'ReplacementTemplateData': _dumps(email_data.get('template_data', {}))
             }
-            
-        except ClientError as e:
-            logger.error(f"❌ Bulk email send error: {e}")
-            return {"success": False, "error": str(e)}
+            for email_data in emails_data
+            if email_data['email'] in allowed
+        ]
+        
+        # SendBulkTemplatedEmail accepts at most 50 destinations per call
+        chunks = [
+            destinations[i:i + SES_BULK_MAX_DESTINATIONS]
+            for i in range(0, len(destinations), SES_BULK_MAX_DESTINATIONS)
+        ]
+        semaphore = asyncio.Semaphore(SES_BULK_CONCURRENCY)
+        
+        async def send_chunk(chunk: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                response = await asyncio.to_thread(
+                    self.ses_client.send_bulk_templated_email,
+                    Source=from_email,
+                    Template=template_name,
+                    DefaultTemplateData='{}',
+                    Destinations=chunk
+                )
+                return response['Status']
+        
+        results = await asyncio.gather(*(send_chunk(chunk) for chunk in chunks), return_exceptions=True)
+        
+        message_ids = []
+        sent_count = 0
+        failed_count = 0
+        errors = []
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, ClientError):
+                logger.error(f"❌ Bulk email send error for {len(chunk)} recipients: {result}")
+                failed_count += len(chunk)
+                errors.append(str(result))
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            for status in result:
+                if 'MessageId' in status:
+                    message_ids.append(status['MessageId'])
+                if status['Status'] == 'Success':
+                    sent_count += 1
+                else:
+                    failed_count += 1
+        
+        if errors and len(errors) == len(chunks):
+            return {"success": False, "error": errors[0]}
+        
+        response = {
+            "success": True,
+            "message_ids": message_ids,
+            "sent_count": sent_count,
+            "failed_count": failed_count,
+            "timestamp": datetime.now().isoformat()
+        }
+        if errors:
+            response["errors"] = errors
+        return response
     
     def create_email_template(
         self,
@@ -143,7 +357,14 @@ class SESManager:
         html_template: str,
         text_template: str
     ) -> bool:
-        """Create an email template in SES"""
+        """Create an email template in SES, or update it if its content changed"""
+        digest = hashlib.blake2b(
+            "\x1f".join((subject, html_template, text_template)).encode(), digest_size=16
+        ).hexdigest()
+        known_digest = _known_templates.get(template_name)
+        if known_digest == digest:
+            return True
+        
         try:
             if not self.ses_client:
                 return False
@@ -155,8 +376,21 @@ class SESManager:
                 'TextPart': text_template
             }
             
-            self.ses_client.create_template(Template=template)
-            logger.info(f"✅ Email template '{template_name}' created successfully")
+            if known_digest is None:
+                try:
+                    self.ses_client.create_template(Template=template)
+                    logger.info(f"✅ Email template '{template_name}' created successfully")
+                except ClientError as e:
+                    if e.response['Error']['Code'] != 'AlreadyExists':
+                        raise
+                    # Created earlier or by another process; make sure it has this content
+                    self.ses_client.update_template(Template=template)
+                    logger.info(f"✅ Email template '{template_name}' updated successfully")
+            else:
+                self.ses_client.update_template(Template=template)
+                logger.info(f"✅ Email template '{template_name}' updated successfully")
+            
+            _known_templates[template_name] = digest
             return True
             
         except ClientError as e:
@@ -164,25 +398,35 @@ class SESManager:
             return False
     
     def get_send_statistics(self) -> Dict[str, Any]:
-        """Get SES sending statistics"""
+        """Get SES sending statistics, cached for 30 seconds"""
+        cached = _stats_cache.get("get_send_statistics")
+        if cached is not None:
+            return cached
+        
         try:
             if not self.ses_client:
                 return {"error": "SES client not initialized"}
             
             response = self.ses_client.get_send_statistics()
             
-            return {
+            result = {
                 "success": True,
                 "send_data_points": response['SendDataPoints'],
                 "timestamp": datetime.now().isoformat()
             }
+            _stats_cache["get_send_statistics"] = result
+            return result
             
         except ClientError as e:
             logger.error(f"❌ Failed to get send statistics: {e}")
             return {"success": False, "error": str(e)}
     
     def check_reputation(self) -> Dict[str, Any]:
-        """Check SES account reputation"""
+        """Check SES account reputation, cached for 30 seconds"""
+        cached = _stats_cache.get("check_reputation")
+        if cached is not None:
+            return cached
+        
         try:
             if not self.ses_client:
                 return {"error": "SES client not initialized"}
@@ -190,7 +434,7 @@ class SESManager:
             reputation = self.ses_client.get_reputation()
             quota = self.ses_client.get_send_quota()
             
-            return {
+            result = {
                 "success": True,
                 "reputation": reputation,
                 "daily_quota": quota['Max24HourSend'],
@@ -198,6 +442,8 @@ class SESManager:
                 "send_rate": quota['MaxSendRate'],
                 "timestamp": datetime.now().isoformat()
             }
+            _stats_cache["check_reputation"] = result
+            return result
             
         except ClientError as e:
             logger.error(f"❌ Failed to check reputation: {e}")
@@ -209,22 +455,26 @@ class SESManager:
             notification_type = notification.get('notificationType')
             
             if notification_type == 'Bounce':
-                bounce_type = notification['bounce']['bounceType']
-                bounced_recipients = notification['bounce']['bouncedRecipients']
-                
-                for recipient in bounced_recipients:
-                    email = recipient['emailAddress']
+                bounce = notification.get('bounce') or {}
+                bounce_type = bounce.get('bounceType', '')
+                # Transient bounces (full mailbox, throttling) may succeed later
+                suppress = bounce_type == 'Permanent'
+                for recipient in bounce.get('bouncedRecipients') or ():
+                    email = recipient.get('emailAddress')
                     logger.warning(f"⚠️  Email bounced ({bounce_type}): {email}")
-                    # Add to suppression list or mark in database
+                    if suppress and email:
+                        _suppress(email, "bounce", bounce_type)
                     
             elif notification_type == 'Complaint':
-                complained_recipients = notification['complaint']['complainedRecipients']
-                
-                for recipient in complained_recipients:
-                    email = recipient['emailAddress']
+                complaint = notification.get('complaint') or {}
+                feedback_type = complaint.get('complaintFeedbackType', '')
+                for recipient in complaint.get('complainedRecipients') or ():
+                    email = recipient.get('emailAddress')
                     logger.warning(f"⚠️  Spam complaint received: {email}")
-                    # Add to suppression list immediately
+                    if email:
+                        _suppress(email, "complaint", feedback_type)
             
+            _schedule_suppression_flush()
             return True
             
         except Exception as e:
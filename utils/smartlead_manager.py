@@ -3,73 +3,207 @@ Smartlead.ai API Manager for COOGI
 Handles AI-powered email campaigns through Smartlead.ai API
 """
 import os
-import requests
+import asyncio
+import functools
+import httpx
 import logging
 import time
 import json
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
+# Use faster JSON encoder/decoder if available
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+BASE_URL = "https://server.smartlead.ai/api/v1"
+LEAD_UPLOAD_BATCH_SIZE = 100  # Smartlead accepts at most 100 leads per upload
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+# 502/504 may mean the server did the work, so POSTs only retry when it surely didn't
+POST_RETRY_STATUSES = frozenset({429, 503})
+MAX_ATTEMPTS = 5
+MAX_RETRY_DELAY = 60  # seconds
+
+# Standardized campaign fields and their defaults
+_CAMPAIGN_FIELDS = (
+    ("id", None),
+    ("name", None),
+    ("status", "active"),
+    ("from_email", None),
+    ("from_name", None),
+    ("created_at", None),
+    ("leads_count", 0),
+    ("sent_count", 0),
+    ("open_rate", 0),
+    ("reply_rate", 0),
+    ("click_rate", 0)
+)
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying, honouring Retry-After when the server sends it"""
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0.0), MAX_RETRY_DELAY)
+        except ValueError:
+            # HTTP-date form; fall back to exponential backoff
+            pass
+    return min(0.5 * 2 ** attempt, MAX_RETRY_DELAY)
+
+class _TokenBucket:
+    """Token bucket limiter: bursts up to capacity, averaging at most rate requests per second"""
+    
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait until a token is available and take it"""
+        async with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens < 1:
+                # Waiting under the lock keeps callers in FIFO order
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self.tokens = 1
+                self.updated = time.monotonic()
+            self.tokens -= 1
+
+# Smartlead allows 2 requests per second per account; shared by every manager instance
+_rate_limiter = _TokenBucket(rate=2.0, capacity=10.0)
+
+_client: Optional[httpx.AsyncClient] = None
+
+# Results of idempotent GETs shared by all instances: key -> (expires_at, result)
+_get_cache: Dict[str, tuple] = {}
+cache_stats = {"hits": 0, "misses": 0}
+
+def get_client() -> httpx.AsyncClient:
+    """Get the shared keep-alive client so concurrent Smartlead calls reuse pooled connections"""
+    global _client
+    if _client is None:
+        # HTTP/2 lets concurrent stats/pause/resume calls multiplex over one connection
+        _client = httpx.AsyncClient(
+            base_url=BASE_URL,
+            http2=True,
+            headers={"Content-Type": "application/json"},
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+            timeout=30
+        )
+    return _client
+
+async def close_client():
+    """Close the shared Smartlead client if it was opened"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+def _ttl(seconds: float):
+    """Serve the last result of an async method for the given number of seconds"""
+    def deco(f):
+        cached = [0.0, None]
+        @functools.wraps(f)
+        async def wrap(self, *args, **kwargs):
+            now = time.monotonic()
+            if cached[1] is None or now - cached[0] > seconds:
+                cached[:] = [now, await f(self, *args, **kwargs)]
+            return cached[1]
+        return wrap
+    return deco
+
 class SmartleadManager:
     """Smartlead.ai API manager for AI-powered email campaigns"""
     
     def __init__(self):
         """Initialize Smartlead.ai API client"""
         self.api_key = os.getenv('SMARTLEAD_API_KEY', '')
-        self.base_url = "https://server.smartlead.ai/api/v1"
+        self.base_url = BASE_URL
+        self.client = get_client()
+        self.enabled = bool(self.api_key)
         
-        # Rate limiting
-        self.requests_per_second = 2
-        self.last_request_time = 0
-        
-        if self.api_key:
+        if self.enabled:
             logger.info("✅ Smartlead Manager initialized successfully")
         else:
             logger.warning("⚠️  Smartlead Manager initialized without API key")
     
-    def _make_request(self, method: str, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    async def _make_request(self, method: str, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Make rate-limited request to Smartlead API"""
+        if not self.enabled:
+            return {"error": "missing_api_key", "message": "SMARTLEAD_API_KEY not set"}
+        
         try:
-            # Rate limiting
-            current_time = time.time()
-            time_since_last = current_time - self.last_request_time
-            if time_since_last < 0.5:  # 0.5 seconds between requests
-                time.sleep(0.5 - time_since_last)
-            
-            url = f"{self.base_url}{endpoint}"
-            headers = {
-                "Content-Type": "application/json"
-            }
+            method = method.upper()
             
             # SmartLead.ai uses API key as query parameter
             params = {"api_key": self.api_key}
-            if data and method.upper() == "GET":
+            if data and method == "GET":
                 params.update(data)
             
-            self.last_request_time = time.time()
+            # Serialize once, outside the retry loop
+            body = None
+            if data is not None and method in ("POST", "PUT"):
+                body = orjson.dumps(data) if orjson else json.dumps(data).encode()
             
-            if method.upper() == "GET":
-                response = requests.get(url, headers=headers, params=params, timeout=30)
-            elif method.upper() == "POST":
-                response = requests.post(url, headers=headers, params=params, json=data, timeout=30)
-            elif method.upper() == "PUT":
-                response = requests.put(url, headers=headers, params=params, json=data, timeout=30)
-            elif method.upper() == "DELETE":
-                response = requests.delete(url, headers=headers, params=params, timeout=30)
+            retry_statuses = POST_RETRY_STATUSES if method == "POST" else RETRY_STATUSES
+            for attempt in range(MAX_ATTEMPTS):
+                await _rate_limiter.acquire()
+                
+                response = await self.client.request(
+                    method,
+                    endpoint,
+                    params=params,
+                    content=body
+                )
+                
+                if response.status_code in retry_statuses and attempt < MAX_ATTEMPTS - 1:
+                    delay = _retry_delay(response, attempt)
+                    logger.warning("⚠️  Smartlead returned %s for %s, retrying in %ss", response.status_code, endpoint, delay)
+                    await asyncio.sleep(delay)
+                    continue
+                break
             
             if response.status_code in [200, 201]:
-                return response.json()
+                return orjson.loads(response.content) if orjson else response.json()
             else:
-                logger.error(f"Smartlead API error: {response.status_code} - {response.text}")
+                logger.error("Smartlead API error: %s - %s", response.status_code, response.text)
                 return {"error": f"API request failed: {response.status_code}", "message": response.text}
                 
         except Exception as e:
-            logger.error(f"Smartlead request failed: {e}")
+            logger.error("Smartlead request failed: %s", e)
             return {"error": str(e)}
     
-    def create_campaign(
+    async def _cached(self, key: str, ttl: float, fetch) -> Dict[str, Any]:
+        """Return a fresh cached result for key, or fetch and cache it if successful"""
+        entry = _get_cache.get(key)
+        if entry is not None and time.monotonic() < entry[0]:
+            cache_stats["hits"] += 1
+            return entry[1]
+        
+        cache_stats["misses"] += 1
+        result = await fetch()
+        if result.get("success"):
+            _get_cache[key] = (time.monotonic() + ttl, result)
+        return result
+    
+    def invalidate(self, *keys: str):
+        """Drop cached GET results so the next read goes to the API"""
+        for key in keys:
+            _get_cache.pop(key, None)
+    
+    async def close(self):
+        """Close the shared HTTP client and its pooled connections"""
+        await close_client()
+    
+    async def create_campaign(
         self,
         name: str,
         leads: List[Dict[str, Any]],
@@ -85,15 +219,16 @@ class SmartleadManager:
                 "name": name
             }
             
-            logger.info(f"📧 Creating Smartlead campaign: {name}")
-            campaign_result = self._make_request("POST", "/campaigns/create", campaign_data)
+            logger.info("📧 Creating Smartlead campaign: %s", name)
+            campaign_result = await self._make_request("POST", "/campaigns/create", campaign_data)
             
             if "error" in campaign_result:
                 return {"success": False, "error": campaign_result["error"]}
             
             campaign_id = campaign_result.get("id")
+            self.invalidate("campaigns", "account_info")
             
-            # Step 2: Create email sequence
+            # Step 2: Build the email sequence and lead payloads
             sequence_data = {
                 "campaign_id": campaign_id,
                 "subject": subject,
@@ -103,40 +238,61 @@ class SmartleadManager:
                 "delay_minutes": 0
             }
             
-            sequence_result = self._make_request("POST", "/sequences", sequence_data)
-            
-            if "error" in sequence_result:
-                return {"success": False, "error": f"Campaign created but sequence failed: {sequence_result['error']}"}
-            
-            # Step 3: Add leads to campaign
-            leads_added = 0
-            failed_leads = []
-            
+            lead_list = []
+            append_lead = lead_list.append
             for lead in leads:
-                lead_data = {
-                    "campaign_id": campaign_id,
+                parts = (lead.get("name") or "").strip().split(maxsplit=1)
+                append_lead({
                     "email": lead.get("email", ""),
-                    "first_name": lead.get("name", "").split()[0] if lead.get("name") else "",
-                    "last_name": " ".join(lead.get("name", "").split()[1:]) if len(lead.get("name", "").split()) > 1 else "",
-                    "company": lead.get("company", ""),
-                    "title": lead.get("title", ""),
+                    "first_name": parts[0] if parts else "",
+                    "last_name": parts[1] if len(parts) > 1 else "",
+                    "company_name": lead.get("company", ""),
                     "custom_fields": {
+                        "title": lead.get("title", ""),
                         "job_title": lead.get("job_title", ""),
                         "job_url": lead.get("job_url", ""),
                         "score": lead.get("score", 0),
                         "company_website": lead.get("company_website", "")
                     }
-                }
-                
-                lead_result = self._make_request("POST", "/leads", lead_data)
+                })
+            
+            leads_added = 0
+            failed_leads = []
+            
+            chunks = [
+                lead_list[start:start + LEAD_UPLOAD_BATCH_SIZE]
+                for start in range(0, len(lead_list), LEAD_UPLOAD_BATCH_SIZE)
+            ]
+            
+            # Step 3: Sequence and lead uploads only depend on the campaign id, so send them together
+            sequence_result, *upload_results = await asyncio.gather(
+                self._make_request("POST", "/sequences", sequence_data),
+                *(
+                    self._make_request("POST", f"/campaigns/{campaign_id}/leads", {"lead_list": chunk})
+                    for chunk in chunks
+                )
+            )
+            
+            if "error" in sequence_result:
+                return {"success": False, "campaign_id": campaign_id, "error": f"Campaign created but sequence failed: {sequence_result['error']}"}
+            
+            for chunk, upload_result in zip(chunks, upload_results):
+                if "error" in upload_result:
+                    failed_leads.extend(
+                        {"email": lead["email"], "error": upload_result["error"]} for lead in chunk
+                    )
+                    continue
                 
-                if "error" not in lead_result:
-                    leads_added += 1
-                else:
-                    failed_leads.append({
-                        "email": lead.get("email"),
-                        "error": lead_result["error"]
-                    })
+                uploaded = upload_result.get("upload_count", len(chunk))
+                leads_added += uploaded
+                skipped = len(chunk) - uploaded
+                if skipped > 0:
+                    errors = upload_result.get("errors") or []
+                    failed_leads.extend(errors[:skipped])
+                    failed_leads.extend(
+                        {"email": None, "error": "Rejected by Smartlead (duplicate, invalid or unsubscribed)"}
+                        for _ in range(skipped - min(skipped, len(errors)))
+                    )
             
             return {
                 "success": True,
@@ -149,35 +305,27 @@ class SmartleadManager:
             }
             
         except Exception as e:
-            logger.error(f"Smartlead campaign creation failed: {e}")
+            logger.error("Smartlead campaign creation failed: %s", e)
             return {"success": False, "error": str(e)}
     
-    def get_campaigns(self) -> Dict[str, Any]:
-        """Get all Smartlead campaigns"""
+    async def get_campaigns(self) -> Dict[str, Any]:
+        """Get all Smartlead campaigns, cached for 30 seconds"""
+        return await self._cached("campaigns", 30, self._get_campaigns)
+    
+    async def _get_campaigns(self) -> Dict[str, Any]:
+        """Fetch all Smartlead campaigns"""
         try:
-            result = self._make_request("GET", "/campaigns/")
+            result = await self._make_request("GET", "/campaigns/")
             
             if "error" not in result:
                 # SmartLead returns campaigns directly as array, not in a "data" wrapper
                 campaigns = result if isinstance(result, list) else result.get("data", [])
                 
                 # Standardize campaign format
-                standardized_campaigns = []
-                for campaign in campaigns:
-                    standardized_campaign = {
-                        "id": campaign.get("id"),
-                        "name": campaign.get("name"),
-                        "status": campaign.get("status", "active"),
-                        "from_email": campaign.get("from_email"),
-                        "from_name": campaign.get("from_name"),
-                        "created_at": campaign.get("created_at"),
-                        "leads_count": campaign.get("leads_count", 0),
-                        "sent_count": campaign.get("sent_count", 0),
-                        "open_rate": campaign.get("open_rate", 0),
-                        "reply_rate": campaign.get("reply_rate", 0),
-                        "click_rate": campaign.get("click_rate", 0)
-                    }
-                    standardized_campaigns.append(standardized_campaign)
+                standardized_campaigns = [
+                    {field: campaign.get(field, default) for field, default in _CAMPAIGN_FIELDS}
+                    for campaign in campaigns
+                ]
                 
                 return {
                     "success": True,
@@ -189,13 +337,19 @@ class SmartleadManager:
                 return {"success": False, "error": result["error"]}
                 
         except Exception as e:
-            logger.error(f"Smartlead get campaigns failed: {e}")
+            logger.error("Smartlead get campaigns failed: %s", e)
             return {"success": False, "error": str(e)}
     
-    def get_campaign_stats(self, campaign_id: str) -> Dict[str, Any]:
-        """Get detailed statistics for a specific campaign"""
+    async def get_campaign_stats(self, campaign_id: str) -> Dict[str, Any]:
+        """Get detailed statistics for a specific campaign, cached for 15 seconds"""
+        return await self._cached(
+            f"campaign_stats:{campaign_id}", 15, lambda: self._get_campaign_stats(campaign_id)
+        )
+    
+    async def _get_campaign_stats(self, campaign_id: str) -> Dict[str, Any]:
+        """Fetch detailed statistics for a specific campaign"""
         try:
-            result = self._make_request("GET", f"/campaigns/{campaign_id}/stats")
+            result = await self._make_request("GET", f"/campaigns/{campaign_id}/stats")
             
             if "error" not in result:
                 stats = result.get("data", {})
@@ -221,16 +375,17 @@ class SmartleadManager:
                 return {"success": False, "error": result["error"]}
                 
         except Exception as e:
-            logger.error(f"Smartlead campaign stats failed: {e}")
+            logger.error("Smartlead campaign stats failed: %s", e)
             return {"success": False, "error": str(e)}
     
-    def pause_campaign(self, campaign_id: str) -> Dict[str, Any]:
+    async def pause_campaign(self, campaign_id: str) -> Dict[str, Any]:
         """Pause a Smartlead campaign"""
         try:
             data = {"status": "paused"}
-            result = self._make_request("PUT", f"/campaigns/{campaign_id}", data)
+            result = await self._make_request("PUT", f"/campaigns/{campaign_id}", data)
             
             if "error" not in result:
+                self.invalidate("campaigns", f"campaign_stats:{campaign_id}")
                 return {
                     "success": True,
                     "campaign_id": campaign_id,
@@ -241,16 +396,17 @@ class SmartleadManager:
                 return {"success": False, "error": result["error"]}
                 
         except Exception as e:
-            logger.error(f"Smartlead pause campaign failed: {e}")
+            logger.error("Smartlead pause campaign failed: %s", e)
             return {"success": False, "error": str(e)}
     
-    def resume_campaign(self, campaign_id: str) -> Dict[str, Any]:
+    async def resume_campaign(self, campaign_id: str) -> Dict[str, Any]:
         """Resume a paused Smartlead campaign"""
         try:
             data = {"status": "active"}
-            result = self._make_request("PUT", f"/campaigns/{campaign_id}", data)
+            result = await self._make_request("PUT", f"/campaigns/{campaign_id}", data)
             
             if "error" not in result:
+                self.invalidate("campaigns", f"campaign_stats:{campaign_id}")
                 return {
                     "success": True,
                     "campaign_id": campaign_id,
@@ -261,15 +417,24 @@ class SmartleadManager:
                 return {"success": False, "error": result["error"]}
                 
         except Exception as e:
-            logger.error(f"Smartlead resume campaign failed: {e}")
+            logger.error("Smartlead resume campaign failed: %s", e)
             return {"success": False, "error": str(e)}
     
-    def delete_campaign(self, campaign_id: str) -> Dict[str, Any]:
+    async def pause_many(self, campaign_ids: List[str]) -> List[Dict[str, Any]]:
+        """Pause several campaigns concurrently; the shared rate limiter still paces the calls"""
+        return await asyncio.gather(*(self.pause_campaign(campaign_id) for campaign_id in campaign_ids))
+    
+    async def resume_many(self, campaign_ids: List[str]) -> List[Dict[str, Any]]:
+        """Resume several campaigns concurrently; the shared rate limiter still paces the calls"""
+        return await asyncio.gather(*(self.resume_campaign(campaign_id) for campaign_id in campaign_ids))
+    
+    async def delete_campaign(self, campaign_id: str) -> Dict[str, Any]:
         """Delete a Smartlead campaign"""
         try:
-            result = self._make_request("DELETE", f"/campaigns/{campaign_id}")
+            result = await self._make_request("DELETE", f"/campaigns/{campaign_id}")
             
             if "error" not in result:
+                self.invalidate("campaigns", f"campaign_stats:{campaign_id}")
                 return {
                     "success": True,
                     "campaign_id": campaign_id,
@@ -280,14 +445,18 @@ class SmartleadManager:
                 return {"success": False, "error": result["error"]}
                 
         except Exception as e:
-            logger.error(f"Smartlead delete campaign failed: {e}")
+            logger.error("Smartlead delete campaign failed: %s", e)
             return {"success": False, "error": str(e)}
     
-    def get_account_info(self) -> Dict[str, Any]:
-        """Get Smartlead account information via campaigns endpoint (no direct account endpoint available)"""
+    async def get_account_info(self) -> Dict[str, Any]:
+        """Get Smartlead account information, cached for 5 minutes"""
+        return await self._cached("account_info", 300, self._get_account_info)
+    
+    async def _get_account_info(self) -> Dict[str, Any]:
+        """Fetch Smartlead account information via campaigns endpoint (no direct account endpoint available)"""
         try:
             # Since SmartLead doesn't have a direct account endpoint, we'll use campaigns to test API access
-            result = self._make_request("GET", "/campaigns/")
+            result = await self._make_request("GET", "/campaigns/")
             
             if "error" not in result:
                 # If we can access campaigns, the API key is valid
@@ -310,14 +479,23 @@ class SmartleadManager:
                 return {"success": False, "error": result["error"]}
                 
         except Exception as e:
-            logger.error(f"Smartlead account info failed: {e}")
+            logger.error("Smartlead account info failed: %s", e)
             return {"success": False, "error": str(e)}
     
-    def test_api_connection(self) -> Dict[str, Any]:
-        """Test Smartlead API connection and key validity"""
+    @_ttl(30)
+    async def test_api_connection(self) -> Dict[str, Any]:
+        """Test Smartlead API connection and key validity, cached for 30 seconds to spare the quota"""
+        if not self.enabled:
+            return {
+                "status": "disabled",
+                "api_key_valid": False,
+                "error": "SMARTLEAD_API_KEY not set",
+                "timestamp": datetime.now().isoformat()
+            }
+        
         try:
             start_time = time.time()
-            result = self.get_account_info()
+            result = await self.get_account_info()
             response_time = time.time() - start_time
             
             if result.get("success"):
@@ -338,7 +516,7 @@ class SmartleadManager:
                 }
                 
         except Exception as e:
-            logger.error(f"Smartlead API test failed: {e}")
+            logger.error("Smartlead API test failed: %s", e)
             return {
                 "status": "error",
                 "api_key_valid": False,
@@ -346,7 +524,7 @@ class SmartleadManager:
                 "timestamp": datetime.now().isoformat()
             }
     
-    def create_ai_personalized_campaign(
+    async def create_ai_personalized_campaign(
         self,
         name: str,
         leads: List[Dict[str, Any]],
@@ -370,10 +548,10 @@ class SmartleadManager:
                 "context": template_context
             }
             
-            logger.info(f"🤖 Creating AI-personalized Smartlead campaign: {name}")
+            logger.info("🤖 Creating AI-personalized Smartlead campaign: %s", name)
             
             # Use the standard campaign creation but with AI enhancement flags
-            result = self.create_campaign(
+            result = await self.create_campaign(
                 name=name,
                 leads=leads,
                 email_template=template_context,
@@ -388,5 +566,5 @@ class SmartleadManager:
             return result
             
         except Exception as e:
-            logger.error(f"Smartlead AI campaign creation failed: {e}")
+            logger.error("Smartlead AI campaign creation failed: %s", e)
             return {"success": False, "error": str(e)}